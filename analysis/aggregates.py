@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from analysis.binning import bin_counts, frequency_table
+from analysis.charts import histogram_bars
+from analysis.loader import DATA_PATH, run_version
+from analysis.profiling import stage
+from analysis.query import NO_FILTERS, load_slice
+
+YEAR_MIN, YEAR_MAX = 1990, 2025   # Release years shown on the Home page
+CUBE_COLS = ["Launch.Price", "Reviews.Total", "Revenue.Estimated", "Release Year", "Release Month"]   # No Title
+
+# Frequency table specs: option -> (column, step, max, label prefix)
+FREQUENCY_OPTIONS = {
+    "Launch Price": ("Launch.Price", 10, 60, "$"),
+    "Reviews Total": ("Reviews.Total", 50000, 300000, ""),
+    "Revenue Estimated": ("Revenue.Estimated", 1500000, 9000000, "$")
+}
+
+# Bar-chart bin schemes: option -> (column, bin edges, labels, bin column name)
+revenue_bins = [0, 1.5e6, 3e6, 4.5e6, 6e6, 7.5e6, 9e6, 10.5e6, 12e6, 13.5e6, 15e6]
+review_bins = list(range(0, 550000, 50000))
+price_bins = [0, 10, 20, 30, 40, 50, 60, 70, 80]
+BAR_BINS = {
+    "Revenue Estimated": ("Revenue.Estimated", revenue_bins,
+                          [f"${int(b/1e6)}M - ${int(revenue_bins[i+1]/1e6)}M" for i, b in enumerate(revenue_bins[:-1])],
+                          "Revenue.Bin"),
+    "Reviews Total": ("Reviews.Total", review_bins,
+                      [f"{i//1000}k - {j//1000}k" for i, j in zip(review_bins[:-1], review_bins[1:])],
+                      "Reviews.Bin"),
+    "Launch Price": ("Launch.Price", price_bins,
+                     [f"${price_bins[i]} - ${price_bins[i+1]}" for i in range(len(price_bins)-1)],
+                     "Launch.Price.Bin"),
+}
+
+
+def year_filter(df):
+    return df[(df['Release Year'] >= YEAR_MIN) & (df['Release Year'] <= YEAR_MAX)]
+
+
+def build_cube(df):
+    """All Home bar/line chart aggregates in one pass over the frame; each entry is a small Series."""
+    return {**additive_cube(df), **range_histograms(df)}
+
+
+def additive_cube(df):
+    """The cube entries that are sums over rows (fixed bins), so they can be updated row by row."""
+    cube = {}
+    with stage("binning"):
+        for option, (col, bins, labels, bin_name) in BAR_BINS.items():
+            cube[option] = pd.Series(bin_counts(df[col], bins), index=pd.CategoricalIndex(labels, ordered=True, name=bin_name))
+    with stage("groupby"):
+        years, months = range(YEAR_MIN, YEAR_MAX + 1), range(1, 13)
+        cube["Total Games Released Per Year"] = df['Release Year'].value_counts().reindex(years, fill_value=0).sort_index()
+        cube["Total Revenue Per Year"] = df.groupby('Release Year')['Revenue.Estimated'].sum().reindex(years, fill_value=0)
+        cube["Total Games Released Per Month"] = df['Release Month'].value_counts().reindex(months, fill_value=0).sort_index()
+        cube["Total Revenue Per Month"] = df.groupby('Release Month')['Revenue.Estimated'].sum().reindex(months, fill_value=0)
+    with stage("histograms"):   # (edges, heights), binned here so the browser never receives raw values
+        cube["Histogram: Launch Price"] = histogram_bars(df['Launch.Price'], bins=np.arange(0, 85, 5))
+    return cube
+
+
+def range_histograms(df):
+    """Histograms whose 50 bins span the data's range; any change to the extremes moves every edge."""
+    with stage("histograms"):
+        return {"Histogram: Revenue Estimated": histogram_bars(np.log(df['Revenue.Estimated'] + 1), bins=50),
+                "Histogram: Reviews Total": histogram_bars(np.log(df['Reviews.Total'] + 1), bins=50)}
+
+
+def update_cube(cube, removed, added):
+    """``additive_cube`` of a frame after ``removed`` rows were dropped and ``added`` rows appended.
+
+    Costs two passes over the changed rows only; both frames should already be year-filtered.
+    """
+    minus, plus = additive_cube(removed), additive_cube(added)
+    out = {}
+    for key, value in cube.items():
+        if isinstance(value, tuple):   # (edges, heights)
+            out[key] = (value[0], value[1] - minus[key][1] + plus[key][1])
+        else:
+            out[key] = value - minus[key] + plus[key]
+    return out
+
+
+# Built once per (dataset version, slice); chart switches are then dictionary lookups
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _cached_cube(path, version, filters):
+    if filters.empty and version[-1]:   # Live deltas applied: adjust the running sums instead of re-binning
+        from analysis.live import get_store
+        store = get_store(path, version)
+        cube = store and store.cube(version[-1])
+        if cube is not None:   # Only the range-dependent histograms still read the rows
+            return {**cube, **range_histograms(year_filter(load_slice(filters, CUBE_COLS, path, version)))}
+    return build_cube(year_filter(load_slice(filters, CUBE_COLS, path, version)))
+
+
+def load_cube(filters=NO_FILTERS, path=DATA_PATH, version=None):
+    return _cached_cube(path, version or run_version(path), filters)
+
+
+# Frequency tables are cached per (dataset version, slice, column, step, max) spec
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_frequency_table(path, version, filters, column, step, max_val, prefix):
+    return frequency_table(year_filter(load_slice(filters, CUBE_COLS, path, version))[column].to_numpy(), step, max_val, prefix)
+
+
+def load_frequency_table(column, step, max_val, prefix="$", filters=NO_FILTERS, path=DATA_PATH, version=None):
+    return _cached_frequency_table(path, version or run_version(path), filters, column, step, max_val, prefix)
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+from analysis.profiling import stage
+
+
+def fmt_money(val, prefix="$"):
+    return f"{prefix}{val / 1_000_000:.1f}M" if val >= 1e6 else f"{prefix}{val / 1_000:.0f}K" if val >= 1e3 else f"{prefix}{val}"
+
+
+def step_edges(step, max_val):
+    """Edges 0, step, ..., max_val plus an open-ended last bin."""
+    return np.append(np.arange(0, max_val + step, step, dtype=float), np.inf)
+
+
+def step_labels(step, max_val, prefix="$"):
+    edges = list(range(0, max_val + step, step))
+    return [f"{fmt_money(edges[i], prefix)} - {fmt_money(edges[i+1], prefix)}" for i in range(len(edges)-1)] + [f">{fmt_money(max_val, prefix)}"]
+
+
+def bin_counts(values, edges):
+    """Counts per left-closed bin [edges[i], edges[i+1]); values outside the edges (and NaN) are dropped."""
+    values = np.asarray(values, dtype=float)
+    idx = np.searchsorted(edges, values, side='right') - 1
+    n_bins = len(edges) - 1
+    return np.bincount(idx[(idx >= 0) & (idx < n_bins)], minlength=n_bins)
+
+
+def step_counts(values, step, max_val):
+    """bin_counts for step_edges without the binary search: equal-width bins index by division."""
+    values = np.asarray(values, dtype=float)
+    n_closed = len(range(0, max_val + step, step)) - 1
+    scaled = values / step   # Exact for multiples of step, so edge values land in the right bin
+    np.minimum(scaled, n_closed, out=scaled)   # Everything past the last edge goes to the open bin
+    scaled[~((values >= 0) & (values < np.inf))] = n_closed + 1   # NaN, negatives and +inf go to a discard bin, as pd.cut drops them
+    return np.bincount(scaled.astype(np.intp), minlength=n_closed + 2)[:n_closed + 1]
+
+
+@stage("frequency table")
+def frequency_table(values, step, max_val, prefix="$"):
+    """Frequency, cumulative and relative frequency table; reads the values, never writes to their frame."""
+    freq = step_counts(values, step, max_val)
+    labels = step_labels(step, max_val, prefix)
+    total = freq.sum()
+    return pd.DataFrame({
+        "Range": labels,
+        "Frequency": freq,
+        "Cumulative Frequency": freq.cumsum(),
+        "Relative Frequency (%)": (freq / total * 100 if total else np.zeros(len(freq))).round(2)
+    }, index=labels)
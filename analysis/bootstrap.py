@@ -0,0 +1,183 @@
+"""Vectorised bootstrap: empirical confidence intervals and band probabilities from resampled rows.
+
+Resamples are drawn as (resamples x sample size) index matrices, a chunk at a time so memory stays
+bounded by ``CHUNK_CELLS`` whatever the resample count, and every statistic of a chunk is computed
+with one NumPy reduction along the sample axis. Chunk ``i`` always draws from child ``i`` of
+``SeedSequence(seed)``, so results are identical whether the chunks run inline or across processes.
+
+Statistics are given as tuples over the columns of a 2-D array:
+``("mean", j)``, ``("median", j)``, ``("iqr", j)``, ``("slope", jx, jy)`` (least-squares slope of
+column ``jy`` on ``jx``) and ``("band", j, lo, hi)`` (share of rows with lo <= value < hi).
+
+When the sample size ``m`` is below the row count ``n`` (an m-out-of-n bootstrap), deviations from
+the full-data estimate are scaled by sqrt(m / n) before forming intervals. The bootstrap spread of
+every statistic above shrinks as 1 / sqrt(size), so the intervals keep their width for n rows.
+
+Medians, IQRs and bands do not need the resampled rows at all. A band share of m draws is
+Binomial(m, p) / m, and the k-th smallest of m draws from the data is the sorted data at quantile
+U_(k) ~ Beta(k, m - k + 1). Both are drawn exactly, so those specs cost O(resamples) whatever ``m`` is
+and are always resampled at full size; only means and slopes go through the index matrices.
+"""
+import math
+import numpy as np
+import streamlit as st
+from multiprocessing import shared_memory
+from analysis.loader import DATA_PATH, run_version
+from analysis.parallel import WORKERS, get_pool
+from analysis.profiling import stage
+from analysis.query import NO_FILTERS, load_slice
+
+BOOTSTRAP_RESAMPLES = 2000
+CHUNK_CELLS = 1 << 22         # Sampled values per chunk: 16 MB of int32 indices plus 32 MB per gathered column
+SAMPLE_CAP = 100_000          # Cached page loaders switch to m-out-of-n resampling above this many rows
+PARALLEL_MIN_CELLS = 1 << 25  # Below this many sampled values the pool costs more than it saves
+ORDER_KINDS = ("median", "iqr", "band")   # Drawn from their exact resampling laws, without gathering rows
+
+
+def statistics(sample, specs):
+    """Evaluate ``specs`` on resampled columns; ``sample(j)`` returns column ``j`` as a (resamples x rows) matrix.
+
+    Returns a (resamples x specs) array.
+    """
+    columns, quartiles = {}, {}   # Each column is gathered once; median and IQR share one selection pass
+    def column(j):
+        if j not in columns:
+            columns[j] = sample(j)
+        return columns[j]
+    out = None
+    for s, spec in enumerate(specs):
+        kind, values = spec[0], column(spec[1])
+        if out is None:
+            out = np.empty((values.shape[0], len(specs)))
+        if kind == "mean":
+            out[:, s] = values.mean(axis=1)
+        elif kind in ("median", "iqr"):
+            if spec[1] not in quartiles:
+                quartiles[spec[1]] = np.quantile(values, [0.25, 0.5, 0.75], axis=1)
+            q1, median, q3 = quartiles[spec[1]]
+            out[:, s] = median if kind == "median" else q3 - q1
+        elif kind == "slope":
+            x = values - values.mean(axis=1, keepdims=True)
+            y = column(spec[2])
+            with np.errstate(invalid="ignore", divide="ignore"):
+                out[:, s] = (x * (y - y.mean(axis=1, keepdims=True))).sum(axis=1) / (x * x).sum(axis=1)
+        elif kind == "band":
+            out[:, s] = ((values >= spec[2]) & (values < spec[3])).mean(axis=1)
+        else:
+            raise ValueError(f"Unknown bootstrap statistic: {kind!r}")
+    return out
+
+
+def resample_chunk(data, specs, sample_size, count, seed):
+    """Statistics of ``count`` resamples of ``sample_size`` rows drawn with replacement.
+
+    ``data`` is column-major (columns x rows) so each used column is a fast 1-D gather by one shared index matrix.
+    """
+    rng = np.random.default_rng(seed)
+    n = data.shape[1]
+    index = rng.integers(0, n, (count, sample_size), dtype=np.int32 if n < 2 ** 31 else np.int64)
+    return statistics(lambda j: data[j][index], specs)
+
+
+def resampled_quantiles(sorted_values, qs, m, count, rng):
+    """``np.quantile(sample, qs)`` (linear method) of ``count`` size-``m`` resamples of ``sorted_values``.
+
+    Only the order statistics the interpolation uses are drawn, in increasing rank: given U_(r), the
+    next needed U_(r') is U_(r) + (1 - U_(r)) * Beta(r' - r, m - r' + 1).
+    """
+    n = len(sorted_values)
+    h = (m - 1) * np.asarray(qs, dtype=float)
+    below = np.floor(h).astype(np.int64)
+    above = np.minimum(below + 1, m - 1)
+    u, previous, drawn = np.zeros(count), 0, {}
+    for rank in np.unique(np.concatenate([below, above])) + 1:   # 1-based ranks
+        u = u + (1 - u) * rng.beta(rank - previous, m - rank + 1, count)
+        previous = rank
+        drawn[rank - 1] = sorted_values[np.clip(np.ceil(u * n).astype(np.int64) - 1, 0, n - 1)]
+    return [drawn[b] + (h_ - b) * (drawn[a] - drawn[b]) for b, a, h_ in zip(below, above, h)]
+
+
+def order_replicates(data, specs, resamples, sample_size, seed=0):
+    """(resamples x specs) replicates of median / IQR / band specs, drawn without resampling any rows."""
+    rng = np.random.default_rng(seed)
+    out, quartiles = np.empty((resamples, len(specs))), {}
+    for s, spec in enumerate(specs):
+        kind, values = spec[0], data[:, spec[1]]
+        if kind == "band":
+            share = ((values >= spec[2]) & (values < spec[3])).mean()
+            out[:, s] = rng.binomial(sample_size, share, resamples) / sample_size
+            continue
+        if spec[1] not in quartiles:
+            quartiles[spec[1]] = resampled_quantiles(np.sort(values), [0.25, 0.5, 0.75], sample_size, resamples, rng)
+        q1, median, q3 = quartiles[spec[1]]
+        out[:, s] = median if kind == "median" else q3 - q1
+    return out
+
+
+def _shared_chunk(name, shape, dtype, specs, sample_size, count, seed):
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        return resample_chunk(np.ndarray(shape, dtype=dtype, buffer=shm.buf), specs, sample_size, count, seed)
+    finally:
+        shm.close()
+
+
+def replicates(data, specs, resamples=BOOTSTRAP_RESAMPLES, sample_size=None, seed=0, workers=None,
+               min_cells=PARALLEL_MIN_CELLS):
+    """(resamples x specs) bootstrap replicates of ``specs`` over the rows of a 2-D array."""
+    data = np.ascontiguousarray(np.asarray(data, dtype=float).T)   # Column-major: one contiguous array per column
+    sample_size = sample_size or data.shape[1]
+    per_chunk = max(1, CHUNK_CELLS // sample_size)
+    counts = [min(per_chunk, resamples - start) for start in range(0, resamples, per_chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(counts))
+    workers = workers or WORKERS
+    if workers == 1 or resamples * sample_size < min_cells:
+        return np.vstack([resample_chunk(data, specs, sample_size, c, s) for c, s in zip(counts, seeds)])
+    # Workers attach to one shared copy of the array instead of receiving pickled copies
+    shm = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+    try:
+        np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)[:] = data
+        futures = [get_pool(workers).submit(_shared_chunk, shm.name, data.shape, data.dtype, specs, sample_size, c, s)
+                   for c, s in zip(counts, seeds)]
+        return np.vstack([f.result() for f in futures])
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+@stage("bootstrap")
+def bootstrap(data, specs, resamples=BOOTSTRAP_RESAMPLES, confidence=0.95, sample_size=None, seed=0, workers=None):
+    """Estimate, standard error and percentile interval of each spec; a list aligned with ``specs``."""
+    data = np.asarray(data, dtype=float)
+    data = data[~np.isnan(data).any(axis=1)]
+    specs = [tuple(spec) for spec in specs]
+    if len(data) == 0:
+        return [{"estimate": np.nan, "se": np.nan, "ci_lower": np.nan, "ci_upper": np.nan} for _ in specs]
+    sample_size = min(sample_size or len(data), len(data))
+    estimates = statistics(lambda j: data[None, :, j], specs)[0]
+    reps = np.empty((resamples, len(specs)))
+    fast = [s for s, spec in enumerate(specs) if spec[0] in ORDER_KINDS]
+    gathered = [s for s in range(len(specs)) if s not in fast]
+    if fast:   # Full-size resamples cost nothing extra here, so these are never m-out-of-n
+        reps[:, fast] = order_replicates(data, [specs[s] for s in fast], resamples, len(data), seed)
+    if gathered:
+        reps[:, gathered] = replicates(data, [specs[s] for s in gathered], resamples, sample_size, seed, workers)
+    scale = np.where([spec[0] in ORDER_KINDS for spec in specs], 1.0, math.sqrt(sample_size / len(data)))
+    alpha = (1 - confidence) / 2
+    lower, upper = np.nanquantile(reps, [alpha, 1 - alpha], axis=0)
+    return [{"estimate": est, "se": scale[s] * np.nanstd(reps[:, s], ddof=1),
+             "ci_lower": est + scale[s] * (lower[s] - est), "ci_upper": est + scale[s] * (upper[s] - est)}
+            for s, est in enumerate(estimates)]
+
+
+# Intervals per (dataset version, slice, columns, statistics, resample count)
+@st.cache_resource(show_spinner="Resampling...", max_entries=32)
+def _cached_bootstrap(path, version, filters, columns, specs, resamples):
+    data = load_slice(filters, columns, path, version)[list(columns)].to_numpy(dtype=float)
+    return bootstrap(data, specs, resamples, sample_size=min(len(data), SAMPLE_CAP))
+
+
+def load_bootstrap(columns, specs, resamples=BOOTSTRAP_RESAMPLES, filters=NO_FILTERS, path=DATA_PATH, version=None):
+    """``bootstrap`` over ``columns`` of the (sliced) dataset; spec column positions index into ``columns``."""
+    return _cached_bootstrap(path, version or run_version(path), filters, tuple(columns),
+                             tuple(tuple(spec) for spec in specs), resamples)
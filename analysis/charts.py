@@ -0,0 +1,122 @@
+"""Chart data reduction: histograms are binned on the server and scatters are downsampled, so the
+browser receives bar heights or a bounded number of points instead of every raw value.
+
+The ``*_figure`` builders draw the pages' matplotlib figures; they live here so the benchmark suite
+can run the same rendering stages without Streamlit."""
+import numpy as np
+
+SCATTER_BUDGET = 5000
+
+
+def histogram_bars(values, bins=50, range=None, density=False):
+    """(edges, heights) of a histogram; NaN and inf are dropped before binning."""
+    values = np.asarray(values, dtype=float)
+    values = values[np.isfinite(values)]
+    return np.histogram(values, bins=bins, range=range, density=density)[::-1]
+
+
+def plotly_histogram(edges, heights, **bar_kwargs):
+    """plotly bar chart shaped like px.histogram but carrying only one height per bin."""
+    import plotly.express as px
+    fig = px.bar(x=(edges[:-1] + edges[1:]) / 2, y=heights, **bar_kwargs)
+    fig.update_traces(width=np.diff(edges))
+    fig.update_layout(bargap=0)
+    return fig
+
+
+def draw_histogram(ax, edges, heights, color):
+    """matplotlib bars from precomputed heights, styled like the seaborn histplot they replace."""
+    ax.bar(edges[:-1], heights, width=np.diff(edges), align='edge', color=color, alpha=0.75, edgecolor='#1f1f1f', linewidth=0.5)
+
+
+def stratified_sample(x, y, budget=SCATTER_BUDGET, grid=64, seed=0):
+    """Sorted positions of exactly ``budget`` points (all of them when there are fewer) that keep the scatter's density.
+
+    Points are bucketed into a grid x grid raster, halved until no more cells are occupied than the
+    budget. Every occupied cell keeps one point, so sparse regions and outliers stay visible, and the
+    rest of the budget is shared in proportion to the cells' counts by largest remainder.
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    n = len(x)
+    if n <= budget:
+        return np.arange(n)
+
+    def cell_of(v):
+        lo, hi = v.min(), v.max()
+        return np.minimum(((v - lo) / (hi - lo or 1) * grid).astype(np.intp), grid - 1)
+
+    while True:
+        cell = cell_of(x) * grid + cell_of(y)
+        counts = np.bincount(cell, minlength=grid * grid)
+        if np.count_nonzero(counts) <= budget or grid == 1:
+            break
+        grid //= 2
+    quota = (counts > 0).astype(np.intp)
+    share = (counts - quota) * (budget - quota.sum()) / (n - quota.sum())
+    quota += np.floor(share).astype(np.intp)
+    quota[np.argsort(np.floor(share) - share)[:budget - quota.sum()]] += 1   # Largest remainders first
+    # Random order within each cell, then keep each cell's first `quota` points
+    order = np.lexsort((np.random.default_rng(seed).random(n), cell))
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    rank = np.arange(n) - starts[cell[order]]
+    return np.sort(order[rank < quota[cell[order]]])
+
+
+def box_plot_figure(label, show_outliers, values=None, stats=None):
+    """Box plot of raw ``values`` (seaborn), or of precomputed matplotlib ``bxp`` ``stats`` in streaming mode."""
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots(figsize=(8, 6))
+    if stats is not None:
+        ax.bxp([stats], showfliers=show_outliers, widths=0.8,
+               patch_artist=True, boxprops=dict(facecolor='skyblue'), medianprops=dict(color='black'))
+    else:
+        import seaborn as sns
+        sns.boxplot(data=values, ax=ax, color='skyblue', showfliers=show_outliers)
+    ax.set_title(f"Box Plot of {label} ({'With' if show_outliers else 'Without'} Outliers)")
+    ax.set_ylabel(label)
+    return fig
+
+
+def normal_fit_figure(data, fit, title, label):
+    """50-bar density histogram with the fitted normal curve on top."""
+    import matplotlib.pyplot as plt
+    from scipy.stats import norm
+    mean, std = fit
+    x = np.linspace(data.min(), data.max(), 100)
+    fig, ax = plt.subplots(figsize=(8, 6))
+    edges, heights = histogram_bars(data, bins=50, density=True)   # Draw 50 bars, not every raw value
+    draw_histogram(ax, edges, heights, color="#007bb3")
+    ax.plot(x, norm.pdf(x, mean, std), 'k', lw=2)
+    ax.set(title=title, xlabel=label, ylabel="Density")
+    return fig
+
+
+def regression_figure(X, y, x_range, fit, xlabel, budget=SCATTER_BUDGET):
+    """Density-preserving scatter subset plus the fitted line; the fit itself uses every row."""
+    import matplotlib.pyplot as plt
+    B0, B1 = fit
+    x_line = np.array(x_range)   # A straight line only needs its end points
+    fig, ax = plt.subplots(figsize=(10, 6))
+    shown = stratified_sample(X, y, budget)
+    ax.scatter(X[shown], y[shown], alpha=0.5, color='blue', label='Data')
+    ax.plot(x_line, B0 + B1 * x_line, '--', color='red', label='Regression Line')
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel("Revenue Estimated")
+    ax.legend()
+    return fig
+
+
+def correlation_figure(corr_matrix, names):
+    """Annotated correlation heatmap of a square matrix (array or DataFrame)."""
+    import matplotlib.pyplot as plt
+    values = np.asarray(corr_matrix)
+    fig, ax = plt.subplots()
+    cax = ax.matshow(values, cmap='coolwarm')
+    fig.colorbar(cax)
+    ticks = range(len(names))
+    ax.set_xticks(ticks); ax.set_yticks(ticks)
+    ax.set_xticklabels(names, rotation=90)
+    ax.set_yticklabels(names)
+    for (i, j), val in np.ndenumerate(values):
+        ax.text(j, i, f"{val:.2f}", ha='center', va='center')
+    return fig
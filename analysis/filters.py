@@ -0,0 +1,52 @@
+import numpy as np
+import streamlit as st
+from analysis.loader import DATA_PATH, run_version
+from analysis.profiling import stage
+from analysis.query import NO_FILTERS, load_slice
+
+IQR_MODES = ("sequential", "joint")
+
+
+def iqr_bounds(values):
+    """(lower, upper) Tukey fences for every column of a 2-D array in one vectorized quantile pass."""
+    values = values.reshape(len(values), -1)
+    q1, q3 = np.quantile(values, [0.25, 0.75], axis=0)   # Loader output is NaN-free, so no nanquantile
+    iqr = q3 - q1
+    return q1 - 1.5 * iqr, q3 + 1.5 * iqr
+
+
+def iqr_mask(values, mode="sequential"):
+    """Rows of a 2-D array inside the IQR fences of every column.
+
+    "joint" takes all fences from the full data and applies them at once (order independent).
+    "sequential" reproduces the original page: each column's fences are computed on the rows that
+    survived the previous columns. Both build a single mask; no intermediate frames are copied.
+    """
+    if mode == "joint":
+        lower, upper = iqr_bounds(values)
+        return ((values >= lower) & (values <= upper)).all(axis=1)
+    if mode != "sequential":
+        raise ValueError(f"mode must be one of {IQR_MODES}, got {mode!r}")
+    mask = np.ones(len(values), dtype=bool)
+    for j in range(values.shape[1]):
+        col = values[:, j]
+        lower, upper = iqr_bounds(col[mask])
+        mask &= (col >= lower) & (col <= upper)
+    return mask
+
+
+@stage("IQR filter")
+def iqr_index(df, cols, mode="sequential"):
+    """Positional index of the rows kept by ``iqr_mask``; take columns with it instead of copying the frame."""
+    return np.flatnonzero(iqr_mask(df[list(cols)].to_numpy(dtype=float), mode))
+
+
+# Kept-row positions (the fences applied, not just the fences) per (dataset version, slice, columns, mode);
+# they index into ``load_slice(filters, cols)``
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _cached_iqr_index(path, version, filters, cols, mode):
+    return iqr_index(load_slice(filters, cols, path, version), cols, mode)
+
+
+def load_iqr_index(cols, mode="sequential", filters=NO_FILTERS, path=DATA_PATH, version=None):
+    return _cached_iqr_index(path, version or run_version(path), filters, tuple(cols), mode)
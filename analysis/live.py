@@ -0,0 +1,322 @@
+"""Live dataset refresh: upsert deltas applied on top of the base CSV without re-reading it.
+
+New and updated titles arrive as CSV files (same five columns as the base file) dropped into the
+delta directory next to it, e.g. ``games.deltas/`` for ``games.csv``. Rows are keyed on
+``Title`` + ``Release.Date``: a known key replaces the earlier row, a new key appends one.
+
+``poll(path)`` only counts the delta files (two ``stat`` calls when nothing changed; nothing is
+parsed). The count is part of ``analysis.loader.dataset_version``, so every cache key moves to the
+new version; a page resolves it once per run (``analysis.loader.run_version``) and keeps reading that
+version's frame while later deltas land. Drop files atomically (write elsewhere, then move them in)
+and name them so they sort in arrival order; a file that fails to parse is skipped but still counted.
+
+A ``LiveStore`` is built the first time an in-memory loader asks for a version with deltas; streaming
+pages never build one. It keeps the base frame and every applied delta as immutable segments, Title as
+integer codes into the base categories plus any new titles, a hashed key -> row position map, and the
+positions each delta superseded. Applying a delta parses only the delta, looks its keys up, and adjusts
+the running Home aggregates, moments and slice index by removing the superseded rows and adding the new
+ones: work on the delta rows plus a few linear passes over flat arrays, with no re-parse or re-sort. A
+version's frame is concatenated from the segments' columns on first use, once per process.
+
+    python -m analysis.live add games.csv new_rows.csv   # queue a delta
+    python -m analysis.live compact games.csv            # fold the deltas into the base CSV
+"""
+import os
+import sys
+import time
+import shutil
+import threading
+import warnings
+import numpy as np
+import pandas as pd
+from analysis.aggregates import CUBE_COLS, additive_cube, update_cube, year_filter
+from analysis.loader import DATA_PATH, file_version, parse_games, read_games
+from analysis.parallel import frame_moments, merge_moments, remove_moments
+from analysis.profiling import stage
+from analysis.query import INDEXED_COLS, GameIndex
+
+DELTA_SUFFIX = ".deltas"
+SOURCE_COLS = ["Title", "Reviews.Total", "Release.Date", "Launch.Price", "Revenue.Estimated"]
+_stores = {}   # path -> LiveStore of the current base file
+_counts = {}   # path -> (delta directory mtime, number of delta files)
+_lock = threading.Lock()
+
+
+def delta_dir(path):
+    return os.path.splitext(path)[0] + DELTA_SUFFIX
+
+
+def delta_files(path):
+    """Delta file names in arrival (name) order; hidden and temporary files are still being written."""
+    try:
+        names = os.listdir(delta_dir(path))
+    except FileNotFoundError:
+        return []
+    return sorted(n for n in names if n.endswith(".csv") and not n.startswith("."))
+
+
+def key_hashes(df):
+    """uint64 hash of each row's (Title, Release.Date) upsert key, the same for str and categorical titles.
+
+    Dates are hashed as int64 nanoseconds (NaT included); at 64 bits two distinct keys colliding is
+    vanishingly unlikely.
+    """
+    dates = df['Release.Date'].to_numpy(dtype="datetime64[ns]").view(np.int64)
+    keys = pd.DataFrame({"Title": df['Title'].to_numpy(), "Release.Date": dates})
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy()
+
+
+def read_delta(path, name):
+    """One parsed delta file of ``path``, or None (with a warning) when it is not a games CSV."""
+    try:
+        return parse_games(os.path.join(delta_dir(path), name))
+    except (KeyError, ValueError, pd.errors.ParserError) as err:
+        warnings.warn(f"Skipping delta {name}: {err}")
+        return None
+
+
+class LiveStore:
+    """Base frame plus applied deltas for one version of the base file; thread-safe."""
+
+    def __init__(self, path, base=None):
+        self.path = path
+        self.base = file_version(path) if base is None else tuple(base)
+        df = read_games(path)
+        self.columns = list(df.columns)
+        titles = df['Title']
+        self.title_base, self.title_extra = titles.cat.categories, titles.cat.categories[:0]
+        self._title_dtype = titles.dtype
+        self.segments, self.codes, self.dead = [df.drop(columns="Title")], [titles.cat.codes.to_numpy()], []
+        self.total = len(df)
+        self.alive = np.ones(self.total, dtype=bool)   # Per global position: not superseded by a later row
+        with stage("key map"):
+            hashes = key_hashes(df)
+            last = ~pd.Index(hashes).duplicated(keep="last")
+            # (unique key hashes, their current positions) chunks: the base's, then each delta's new keys
+            self.keys = [(pd.Index(hashes[last]), np.flatnonzero(last))]
+        self.names, self.rejected = [], []   # Delta files seen so far (a rejected one counts as empty), and those rejected
+        self._cube, self._moments, self._index = None, {}, None
+        self._lock = threading.RLock()
+
+    @property
+    def seq(self):
+        return len(self.names)
+
+    def refresh(self, names=None):
+        """Apply the files of ``names`` (default: every queued delta) past those already applied; returns the count."""
+        with self._lock:
+            names = delta_files(self.path) if names is None else names
+            for name in names[self.seq:]:
+                delta = read_delta(self.path, name)
+                if delta is None:   # An empty segment, so seq still counts files like ``poll`` does
+                    self.rejected.append(name)
+                    self.segments.append(self.segments[0].iloc[:0])
+                    self.codes.append(self.codes[0][:0])
+                    self.dead.append(np.array([], dtype=np.intp))
+                else:
+                    self.apply(delta)
+                self.names.append(name)
+            return self.seq
+
+    def title_dtype(self):
+        """Categorical dtype of the base titles followed by those deltas added; rebuilt only when that grows."""
+        if len(self._title_dtype.categories) != len(self.title_base) + len(self.title_extra):
+            self._title_dtype = pd.CategoricalDtype(self.title_base.append(self.title_extra))
+        return self._title_dtype
+
+    def title_codes(self, titles):
+        """Codes of ``titles`` in ``title_dtype``; titles not seen before join the extra categories."""
+        titles = titles if isinstance(titles.dtype, pd.CategoricalDtype) else titles.astype("category")
+        categories = titles.cat.categories
+        codes = self.title_base.get_indexer(categories)
+        new = codes < 0
+        if new.any():
+            extra = self.title_extra.get_indexer(categories[new])
+            self.title_extra = self.title_extra.append(categories[new][extra < 0])
+            codes[new] = len(self.title_base) + self.title_extra.get_indexer(categories[new])
+        return np.append(codes, -1)[titles.cat.codes.to_numpy()]   # Code -1 (missing title) stays -1
+
+    @stage("apply delta")
+    def apply(self, delta):
+        """Upsert a parsed delta frame; only its rows are hashed and looked up."""
+        with self._lock:
+            hashes = key_hashes(delta)
+            last = ~pd.Index(hashes).duplicated(keep="last")   # Within one delta the last row for a key wins
+            delta, hashes = delta[last].reset_index(drop=True), hashes[last]
+            added = np.arange(self.total, self.total + len(delta))
+            found, old = np.zeros(len(delta), dtype=bool), []
+            for keys, positions in self.keys:
+                at = keys.get_indexer(hashes)
+                hit = at >= 0
+                old.append(positions[at[hit]])
+                positions[at[hit]] = added[hit]   # The key now points at its new row
+                found |= hit
+            if not found.all():
+                self.keys.append((pd.Index(hashes[~found]), added[~found]))
+            old = np.concatenate(old)
+            removed = self.rows(old)
+            live_before = np.flatnonzero(self.alive)
+            self.alive[old] = False
+            self.codes.append(self.title_codes(delta['Title']))
+            delta = delta.drop(columns="Title")
+            self.segments.append(delta)
+            self.dead.append(old)
+            self.total += len(delta)
+            if self._index is not None:
+                self._index = self._index.merged(self.alive[live_before], delta)
+            self.alive = np.concatenate([self.alive, np.ones(len(delta), dtype=bool)])
+            if self._cube is not None:
+                self._cube = update_cube(self._cube, year_filter(removed), year_filter(delta))
+            for (columns, log1p), moments in self._moments.items():
+                moments = remove_moments(moments, frame_moments(removed, columns, log1p, workers=1))
+                self._moments[columns, log1p] = merge_moments(moments, frame_moments(delta, columns, log1p, workers=1))
+
+    def rows(self, positions):
+        """Rows at global ``positions`` (over all segments, superseded rows included), without Title."""
+        starts = np.cumsum([0] + [len(s) for s in self.segments[:-1]])
+        owner = np.searchsorted(starts, positions, side="right") - 1
+        parts = [self.segments[i].iloc[positions[owner == i] - starts[i]] for i in np.unique(owner)]
+        return pd.concat(parts, ignore_index=True) if parts else self.segments[0].iloc[:0]
+
+    def frame(self, columns=None, seq=None):
+        """The live rows as of ``seq`` applied deltas (default: all), in base-then-arrival order."""
+        columns = list(columns) if columns else self.columns
+        with self._lock:
+            seq = self.seq if seq is None else seq
+            segments, codes, dead = self.segments[:seq + 1], self.codes[:seq + 1], self.dead[:seq]
+            dtype = self.title_dtype() if "Title" in columns else None
+        with stage("assemble frame"):
+            df = pd.concat([s[[c for c in columns if c != "Title"]] for s in segments], ignore_index=True)
+            if dtype is not None:   # Codes already index the shared categories: no union of category sets
+                df.insert(columns.index("Title"), "Title", pd.Categorical.from_codes(np.concatenate(codes), dtype=dtype))
+            if dead:
+                keep = np.ones(len(df), dtype=bool)
+                keep[np.concatenate(dead)] = False
+                df = df[keep].reset_index(drop=True)
+        return df
+
+    def cube(self, seq):
+        """Running ``additive_cube`` of the year-filtered rows, or None when ``seq`` is not the latest."""
+        with self._lock:
+            if seq != self.seq:
+                return None
+            if self._cube is None:   # Built once per store; later deltas only adjust it
+                self._cube = additive_cube(year_filter(self.frame(CUBE_COLS, seq)))
+            return self._cube
+
+    def moments(self, columns, log1p, seq):
+        """Running count/mean/co-moment of ``columns``, or None when ``seq`` is not the latest."""
+        with self._lock:
+            if seq != self.seq:
+                return None
+            key = (tuple(columns), tuple(log1p))
+            if key not in self._moments:
+                self._moments[key] = frame_moments(self.frame(columns, seq), columns, log1p)
+            return self._moments[key]
+
+    def index(self, seq):
+        """Running ``GameIndex`` of the live rows, or None when ``seq`` is not the latest."""
+        with self._lock:
+            if seq != self.seq:
+                return None
+            if self._index is None:   # Sorted once per store; later deltas are merged in
+                self._index = GameIndex(self.frame(INDEXED_COLS, seq))
+            return self._index
+
+
+def poll(path=DATA_PATH):
+    """Number of delta files queued for ``path`` (0 when there are none); nothing is parsed or loaded."""
+    base = file_version(path)
+    with _lock:
+        if path in _stores and _stores[path].base != base:   # Base file was rewritten (e.g. compacted)
+            del _stores[path]
+    try:
+        mtime = os.stat(delta_dir(path)).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+    with _lock:
+        if path in _counts and _counts[path][0] == mtime:
+            return _counts[path][1]
+    count = len(delta_files(path))
+    with _lock:
+        _counts[path] = (mtime, count)
+    return count
+
+
+def get_store(path, version):
+    """The process-wide store of ``path`` with the deltas of ``version`` (a ``dataset_version``) applied.
+
+    Built on first use; None when the base file has been rewritten or delta files removed since.
+    """
+    base, count = tuple(version[:-1]), version[-1]
+    if base != file_version(path):
+        return None
+    names = delta_files(path)[:count]
+    if len(names) < count:
+        return None
+    with _lock:
+        store = _stores.get(path)
+        n = min(count, store.seq) if store else 0
+        if store is None or store.base != base or store.names[:n] != names[:n]:
+            store = _stores[path] = LiveStore(path, base)
+    store.refresh(names)
+    return store
+
+
+def read_current(path=DATA_PATH, columns=None):
+    """Base file with every delta applied, without the process-wide store (for headless runs)."""
+    if not delta_files(path):
+        return read_games(path, columns)
+    store = LiveStore(path)
+    store.refresh()
+    return store.frame(columns)
+
+
+def read_deltas(path=DATA_PATH, version=None):
+    """All pending deltas as one parsed frame, last row per key, or None when there are none.
+
+    With ``version`` (a ``dataset_version``), only the delta files it counts, in arrival order.
+    """
+    names = delta_files(path)
+    names = names if version is None else names[:version[-1]]
+    frames = [df for df in (read_delta(path, name) for name in names) if df is not None]
+    if not frames:
+        return None
+    deltas = pd.concat(frames, ignore_index=True)
+    return deltas[~pd.Index(key_hashes(deltas)).duplicated(keep="last")].reset_index(drop=True)
+
+
+def add_delta(path, source):
+    """Queue ``source`` as the next delta of ``path`` (copied in, then renamed so pollers never see half a file)."""
+    directory = delta_dir(path)
+    os.makedirs(directory, exist_ok=True)
+    name = f"{time.strftime('%Y%m%dT%H%M%S')}-{time.time_ns() % 10**9:09d}-{os.path.basename(source)}"
+    tmp = os.path.join(directory, "." + name)
+    shutil.copyfile(source, tmp)
+    os.replace(tmp, os.path.join(directory, name))
+    return os.path.join(directory, name)
+
+
+def compact(path):
+    """Rewrite the base CSV with every delta applied and remove the applied delta files."""
+    names = delta_files(path)
+    store = LiveStore(path)
+    store.refresh(names)
+    df = store.frame()
+    tmp = path + ".tmp"
+    df[SOURCE_COLS].to_csv(tmp, index=False, date_format="%Y-%m-%d")
+    os.replace(tmp, path)
+    for name in names:
+        os.remove(os.path.join(delta_dir(path), name))
+    return len(df)
+
+
+if __name__ == "__main__":
+    command, csv, *sources = sys.argv[1:]
+    if command == "add":
+        for source in sources:
+            print(f"{source} -> {add_delta(csv, source)}")
+    elif command == "compact":
+        print(f"{csv}: {compact(csv):,} rows")
+    else:
+        sys.exit(f"unknown command {command!r}; expected 'add' or 'compact'")
@@ -0,0 +1,112 @@
+import os
+import warnings
+import pandas as pd
+import streamlit as st
+from analysis.profiling import stage
+
+DATA_PATH = "games.csv"
+NUMERIC_COLS = ["Launch.Price", "Reviews.Total", "Revenue.Estimated"]
+
+
+def file_version(path):
+    """Cheap fingerprint of a data file: changes whenever the file is rewritten."""
+    info = os.stat(path)
+    return info.st_mtime_ns, info.st_size
+
+
+def dataset_version(path):
+    """``file_version`` plus the number of live deltas applied on top (see ``analysis.live``)."""
+    from analysis.live import poll
+    return file_version(path) + (poll(path),)
+
+
+def pin_version(path=DATA_PATH):
+    """Resolve the dataset version once for this script run (``setup_page`` calls it first)."""
+    st.session_state["_run_versions"] = {path: dataset_version(path)}
+    return st.session_state["_run_versions"][path]
+
+
+def run_version(path=DATA_PATH):
+    """The version every loader of this run uses, so a delta landing mid-run cannot mix two versions.
+
+    Outside a page run (scripts, benchmarks) it is the current ``dataset_version``.
+    """
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return dataset_version(path)
+    pinned = st.session_state.setdefault("_run_versions", {})
+    if path not in pinned:
+        pinned[path] = dataset_version(path)
+    return pinned[path]
+
+
+def parse_games(path):
+    """Parse, type and clean the CSV (one full pass, no caching)."""
+    with stage("read_csv"):
+        df = pd.read_csv(path)
+        df.columns = df.columns.str.strip()
+    with stage("coerce numeric"):
+        for col in NUMERIC_COLS:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+        df.dropna(subset=NUMERIC_COLS, inplace=True)
+        df = df.astype({"Launch.Price": "float64", "Revenue.Estimated": "float64", "Reviews.Total": "int64",
+                        "Title": "category"})
+    with stage("parse dates"):
+        df['Release.Date'] = pd.to_datetime(df['Release.Date'], errors='coerce')
+        df['Release Year'] = df['Release.Date'].dt.year
+        df['Release Month'] = df['Release.Date'].dt.month
+    return df.reset_index(drop=True)
+
+
+def ingest(path=DATA_PATH):
+    """Convert the CSV into a typed columnar snapshot unless an up-to-date one exists; returns its path.
+
+    None without pyarrow, or when the snapshot cannot be written (read-only directory, full disk), so the
+    caller parses the CSV instead.
+    """
+    try:
+        from analysis import snapshot
+    except ImportError:
+        return None
+    snap, version = snapshot.snapshot_path(path), file_version(path)
+    if snapshot.snapshot_version(snap) != version:
+        with stage("ingest"):
+            try:
+                snapshot.write_snapshot(parse_games(path), snap, version)
+            except OSError as err:
+                warnings.warn(f"Cannot write snapshot {snap}: {err}; parsing {path} instead")
+                return None
+    return snap
+
+
+def read_games(path=DATA_PATH, columns=None):
+    """Typed frame from the snapshot (projected, memory mapped), falling back to parsing the CSV."""
+    snap = ingest(path)
+    if snap is None:
+        df = parse_games(path)
+        return df[list(columns)] if columns else df
+    from analysis.snapshot import read_snapshot
+    with stage("read snapshot"):
+        return read_snapshot(snap, list(columns) if columns else None)
+
+
+# One frame per (path, version, projection), shared by every session and rerun in the process; most
+# projections are a few numeric columns, so room for every page's projections costs little
+@st.cache_resource(show_spinner="Loading dataset...", max_entries=16)
+def _cached_games(path, version, columns):
+    if not version[-1]:
+        return read_games(path, columns)
+    from analysis.live import get_store, read_current
+    store = get_store(path, version)   # Base segments stay in memory; only the deltas are parsed
+    return store.frame(columns, version[-1]) if store else read_current(path, columns)
+
+
+def load_games(path=DATA_PATH, columns=None, version=None):
+    """Shared, cleaned games frame. Treat it as read-only: derive new frames instead of adding columns."""
+    return _cached_games(path, version or run_version(path), tuple(columns) if columns else None)
+
+
+if __name__ == "__main__":
+    import sys
+    for csv in sys.argv[1:] or [DATA_PATH]:
+        print(f"{csv} -> {ingest(csv)}")
@@ -0,0 +1,67 @@
+import streamlit as st
+from analysis.profiling import Profiler, active_profiler, release_tracing
+
+POLL_SECONDS = 5   # How often an open page checks for live dataset deltas
+
+# Shared look for every page; Streamlit renders each page from scratch, so each one applies it
+STYLE = """
+    <style>
+    .main, .css-18e3th9, .css-1d391kg, .stApp {
+        background-color: #599cba;
+        color: white;
+    }
+    h1, h3 { color: white; }
+    .nav-item { font-size: 18px; margin-right: 20px; display: inline-block; }
+    .nav-item a { color: white; text-decoration: none; }
+    .nav-item a:hover { color: #ffa500; }
+    </style>
+"""
+
+
+def setup_page(title, subtitle=None):
+    """Apply the shared styling and draw the centred page header. Keep this module import-light:
+    it runs before first paint, so heavy libraries belong inside the functions that draw charts."""
+    _start_profiler()
+    from analysis.loader import DATA_PATH, pin_version
+    pin_version(DATA_PATH)   # Every loader in this run reads this version, even if a delta lands mid-run
+    _watch_dataset()
+    st.markdown(STYLE, unsafe_allow_html=True)
+    st.markdown(f"<h1 style='text-align: center;'>{title}</h1>", unsafe_allow_html=True)
+    if subtitle:
+        st.markdown(f"<h3 style='text-align: center;'>{subtitle}</h3>", unsafe_allow_html=True)
+
+
+def _start_profiler():
+    # A run stopped early (st.stop, an exception) never reached show_stage_timings; reruns use new threads,
+    # so its profiler is found through the session rather than the thread
+    for stale in (st.session_state.pop("_profiler", None), active_profiler()):
+        if stale is not None:
+            stale.__exit__(None, None, None)
+    # The toggle is drawn at the end of the page, so read its state from the previous run
+    if st.session_state.get("_debug_timings", st.session_state.get("debug_timings", False)):
+        st.session_state["_profiler"] = Profiler().__enter__()
+    else:
+        release_tracing()   # Also drops tracing kept by profilers of sessions that have gone away
+
+
+@st.fragment(run_every=POLL_SECONDS)
+def _watch_dataset():
+    """Rerun the page when the data file is rewritten or a live delta lands (see ``analysis.live``)."""
+    from analysis.loader import DATA_PATH, dataset_version, run_version
+    if st.session_state.pop("_dataset_updated", False):
+        st.toast("🔄 Dataset updated")
+    if dataset_version(DATA_PATH) != run_version(DATA_PATH):   # Against the version the page was drawn with
+        st.session_state["_dataset_updated"] = True
+        st.rerun(scope="app")
+
+
+def show_stage_timings():
+    """Debug sidebar: a "Stage timings" toggle and, when on, this run's per-stage latency and peak memory."""
+    profiler = st.session_state.pop("_profiler", None)
+    if profiler is not None:
+        profiler.__exit__(None, None, None)
+    on = st.sidebar.toggle("Stage timings", value=st.session_state.get("debug_timings", False), key="_debug_timings",
+                           help="Wall time and peak traced memory of each stage in this run; cached stages show as near zero.")
+    st.session_state["debug_timings"] = on
+    if on and profiler is not None:
+        st.sidebar.dataframe(profiler.table(), hide_index=True)
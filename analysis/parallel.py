@@ -0,0 +1,172 @@
+"""Partition-and-merge statistics over a process pool.
+
+Each worker reduces a block of rows to sufficient statistics -- count, column means, the co-moment
+matrix sum((x - mean)(x - mean)^T), min/max and a quantile sketch per column -- and the blocks are
+merged exactly with the pairwise (Chan et al.) update. Moments, covariance/correlation and normal-fit
+parameters therefore match a single pass up to floating-point rounding. ``parallel_moments`` takes exact
+quartiles in the parent, which already holds every row; the mergeable sketches of ``partial_moments``
+serve callers that never hold the whole column (their error bound is in analysis.streaming).
+"""
+import os
+import math
+import numpy as np
+import streamlit as st
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+from analysis.loader import DATA_PATH, run_version
+from analysis.profiling import stage
+from analysis.query import NO_FILTERS, load_slice
+from analysis.streaming import QuantileSketch
+
+WORKERS = int(os.environ.get("STEAM_STATS_WORKERS", os.cpu_count() or 1))
+PARALLEL_MIN_ROWS = 1_000_000   # Below this the pool costs more than it saves
+_pools = {}
+
+
+def get_pool(workers):
+    """Process-wide pool per worker count, started once with forkserver so the app's threads are not forked."""
+    if workers not in _pools:
+        _pools[workers] = ProcessPoolExecutor(workers, mp_context=get_context("forkserver"))
+    return _pools[workers]
+
+
+def partial_moments(block, quantiles="sketch"):
+    """Sufficient statistics of a 2-D block (rows x columns); NaN rows are dropped.
+
+    ``quantiles`` is "sketch" (mergeable), "exact" (single partition only) or None to skip them.
+    """
+    block = block[~np.isnan(block).any(axis=1)]
+    n = len(block)
+    mean = block.mean(axis=0) if n else np.zeros(block.shape[1])
+    centered = block - mean
+    part = {
+        "n": n, "mean": mean, "comoment": centered.T @ centered,
+        "min": block.min(axis=0) if n else np.full(block.shape[1], np.inf),
+        "max": block.max(axis=0) if n else np.full(block.shape[1], -np.inf),
+    }
+    if quantiles == "exact":
+        part["quartiles"] = np.quantile(block, [0.25, 0.5, 0.75], axis=0) if n else np.full((3, block.shape[1]), np.nan)
+    elif quantiles == "sketch":
+        part["sketches"] = [QuantileSketch().update(block[:, j]) for j in range(block.shape[1])]
+    return part
+
+
+def merge_moments(a, b):
+    if b["n"] == 0:
+        return a
+    if a["n"] == 0:
+        return b
+    n = a["n"] + b["n"]
+    delta = b["mean"] - a["mean"]
+    merged = {
+        "n": n, "mean": a["mean"] + delta * b["n"] / n,
+        "comoment": a["comoment"] + b["comoment"] + np.outer(delta, delta) * a["n"] * b["n"] / n,
+        "sketches": [sa.merge(sb) for sa, sb in zip(a.get("sketches", []), b.get("sketches", []))],
+    }
+    if "min" in a and "min" in b:   # Absent after remove_moments
+        merged["min"], merged["max"] = np.minimum(a["min"], b["min"]), np.maximum(a["max"], b["max"])
+    return merged
+
+
+def remove_moments(a, b):
+    """Inverse of ``merge_moments``: the count, mean and co-moment of ``a`` without the rows summarised by ``b``.
+
+    Min, max and quantiles cannot be un-merged, so they are not carried.
+    """
+    n = a["n"] - b["n"]
+    if b["n"] == 0:
+        return {"n": a["n"], "mean": a["mean"], "comoment": a["comoment"]}
+    if n <= 0:
+        return {"n": 0}
+    mean = (a["n"] * a["mean"] - b["n"] * b["mean"]) / n
+    delta = b["mean"] - mean
+    return {"n": n, "mean": mean, "comoment": a["comoment"] - b["comoment"] - np.outer(delta, delta) * n * b["n"] / a["n"]}
+
+
+def _shared_block(name, shape, dtype, start, stop, quantiles):
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        return partial_moments(np.ndarray(shape, dtype=dtype, buffer=shm.buf)[start:stop], quantiles)
+    finally:
+        shm.close()
+
+
+@stage("moments")
+def parallel_moments(data, workers=None, min_rows=PARALLEL_MIN_ROWS, quantiles=True):
+    """Merged sufficient statistics of a 2-D float array, split into row partitions across ``workers`` processes."""
+    data = np.asarray(data, dtype=float)
+    workers = workers or WORKERS
+    if workers == 1 or len(data) < min_rows:
+        return partial_moments(data, "exact" if quantiles else None)
+    # Workers attach to one shared copy of the array instead of receiving pickled slices
+    shm = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+    try:
+        np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)[:] = data
+        bounds = np.linspace(0, len(data), workers + 1).astype(int)
+        futures = [get_pool(workers).submit(_shared_block, shm.name, data.shape, data.dtype, lo, hi, None)
+                   for lo, hi in zip(bounds[:-1], bounds[1:])]
+        merged = {"n": 0}
+        for f in futures:
+            merged = merge_moments(merged, f.result())
+    finally:
+        shm.close()
+        shm.unlink()
+    if quantiles:   # Exact, as in the single-partition case: the whole column is already in this process
+        complete = data[~np.isnan(data).any(axis=1)]
+        merged["quartiles"] = (np.quantile(complete, [0.25, 0.5, 0.75], axis=0) if len(complete)
+                               else np.full((3, data.shape[1]), np.nan))
+    return merged
+
+
+def summarize(moments, names):
+    """Per-column descriptive summaries (``analysis.stats.describe`` keys) plus covariance and correlation."""
+    n, comoment = moments["n"], moments["comoment"]
+    cov = comoment / (n - 1) if n > 1 else np.full(comoment.shape, np.nan)
+    std = np.sqrt(np.diag(cov))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        corr = cov / np.outer(std, std)
+    columns = {}
+    for j, name in enumerate(names):
+        if "quartiles" in moments:
+            q1, median, q3 = moments["quartiles"][:, j]
+        else:
+            q1, median, q3 = (moments["sketches"][j].quantile(q) for q in (0.25, 0.5, 0.75))
+        columns[name] = {"n": n, "mean": moments["mean"][j], "var": cov[j, j], "std": std[j],
+                         "min": moments["min"][j], "max": moments["max"][j], "q1": q1, "median": median, "q3": q3}
+    return {"columns": columns, "cov": cov, "corr": corr, "names": list(names)}
+
+
+def normal_fit(moments, j):
+    """Maximum-likelihood normal parameters (same as scipy.stats.norm.fit) for column ``j``."""
+    return moments["mean"][j], math.sqrt(moments["comoment"][j, j] / moments["n"])
+
+
+def describe_frame(df, columns, workers=None):
+    return summarize(parallel_moments(df[list(columns)].to_numpy(dtype=float), workers), columns)
+
+
+def frame_moments(df, columns, log1p=(), workers=None):
+    """Moments of ``columns`` of a frame; names listed in ``log1p`` are transformed with log(1 + x) first."""
+    data = df[list(columns)].to_numpy(dtype=float, copy=True)
+    for j, name in enumerate(columns):
+        if name in log1p:
+            data[:, j] = np.log1p(data[:, j])
+    return parallel_moments(data, workers)
+
+
+# Moments of the shared frame or a slice of it, once per (dataset version, slice, columns, transforms)
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _cached_moments(path, version, filters, columns, log1p, running):
+    if running and filters.empty and version[-1]:
+        from analysis.live import get_store
+        store = get_store(path, version)
+        moments = store and store.moments(columns, log1p, version[-1])
+        if moments is not None:
+            return moments
+    return frame_moments(load_slice(filters, columns, path, version), columns, log1p)
+
+
+def load_moments(columns, log1p=(), filters=NO_FILTERS, path=DATA_PATH, running=False, version=None):
+    """Cached ``frame_moments``. With ``running``, live deltas update count, mean and co-moment in place of a
+    full pass; min, max and quartiles are then absent, so use it only for ``normal_fit``."""
+    return _cached_moments(path, version or run_version(path), filters, tuple(columns), tuple(log1p), running)
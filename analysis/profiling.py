@@ -0,0 +1,111 @@
+"""Per-stage timing and memory instrumentation.
+
+Library code marks its stages with ``with stage("name"):`` (or ``@stage("name")``). Outside a
+``Profiler`` the hook only checks a thread-local and costs well under a microsecond. Inside one,
+each stage records wall time and the peak of Python-tracked allocations above its starting point
+(``tracemalloc``, which NumPy and pandas buffers report to). Nested stages are recorded with their depth,
+and a parent's peak includes its children's.
+
+The profiler is thread-local because each Streamlit script run executes on its own thread.
+``tracemalloc`` is process-wide, though, so peaks taken while several sessions render at once
+include the other sessions' allocations. Tracing started here stops as soon as no profiler that
+needs it is alive, including ones abandoned by a run that stopped early and was never exited.
+"""
+import time
+import weakref
+import threading
+import tracemalloc
+from contextlib import ContextDecorator
+
+_active = threading.local()
+_tracing = {"owners": weakref.WeakSet(), "started": False}   # Memory profilers alive, and whether we started tracing
+_tracing_lock = threading.Lock()
+
+
+def release_tracing():
+    """Stop tracemalloc if this module started it and no memory profiler is alive any more."""
+    with _tracing_lock:
+        if _tracing["started"] and not _tracing["owners"]:
+            tracemalloc.stop()
+            _tracing["started"] = False
+
+
+class Profiler:
+    """Collects one record per stage: name, depth, seconds and peak_mb."""
+
+    def __init__(self, memory=True):
+        self.memory, self.records, self._stack = memory, [], []
+
+    def __enter__(self):
+        if self.memory:
+            with _tracing_lock:
+                _tracing["owners"].add(self)
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    _tracing["started"] = True
+        self._previous = getattr(_active, "profiler", None)
+        _active.profiler = self
+        return self
+
+    def __exit__(self, *exc):
+        """Safe to call from another thread or more than once (e.g. for a run that stopped early)."""
+        if getattr(_active, "profiler", None) is self:
+            _active.profiler = self._previous
+        with _tracing_lock:
+            _tracing["owners"].discard(self)
+        release_tracing()
+        return False
+
+    def _push(self, name):
+        frame = {"stage": name, "depth": len(self._stack), "start": time.perf_counter(), "base": 0, "peak": 0}
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            for outer in self._stack:   # Credit the peak reached so far to the enclosing stages before resetting it
+                outer["peak"] = max(outer["peak"], peak)
+            tracemalloc.reset_peak()
+            frame["base"] = frame["peak"] = current
+        self._stack.append(frame)
+        self.records.append(None)   # Reserve the slot so records stay in start order
+        frame["slot"] = len(self.records) - 1
+
+    def _pop(self):
+        frame = self._stack.pop()
+        seconds = time.perf_counter() - frame["start"]
+        if self.memory:
+            frame["peak"] = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+            if self._stack:
+                self._stack[-1]["peak"] = max(self._stack[-1]["peak"], frame["peak"])
+        self.records[frame["slot"]] = {"stage": frame["stage"], "depth": frame["depth"], "seconds": seconds,
+                                       "peak_mb": (frame["peak"] - frame["base"]) / 2 ** 20 if self.memory else None}
+
+    def table(self):
+        """Records as a DataFrame, child stages indented under their parent."""
+        import pandas as pd
+        return pd.DataFrame([{"Stage": "  " * r["depth"] + r["stage"], "ms": round(r["seconds"] * 1000, 1),
+                              "Peak MB": None if r["peak_mb"] is None else round(r["peak_mb"], 1)}
+                             for r in self.records if r is not None])
+
+
+class stage(ContextDecorator):
+    """Mark a stage for the active ``Profiler`` (no-op when none is active)."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def _recreate_cm(self):
+        return stage(self.name)   # A fresh instance per decorated call, so calls on other threads do not collide
+
+    def __enter__(self):
+        self._profiler = getattr(_active, "profiler", None)
+        if self._profiler is not None:
+            self._profiler._push(self.name)
+        return self
+
+    def __exit__(self, *exc):
+        if self._profiler is not None:
+            self._profiler._pop()
+        return False
+
+
+def active_profiler():
+    return getattr(_active, "profiler", None)
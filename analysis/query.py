@@ -0,0 +1,221 @@
+"""Slicing the dataset by year, price, reviews, revenue and title without full scans.
+
+A ``GameIndex`` is built once per dataset version from the indexed columns only: one stable argsort
+per column, plus the title dictionary once a title filter is first used. A query resolves every range
+predicate to a [start, stop) span of its sorted index by binary search, drives the plan from the
+narrowest span, checks the remaining predicates only on those candidate rows, and returns sorted row
+positions. When even the narrowest span is broad, the
+predicates are intersected as boolean masks over the contiguous columns instead. Row positions and
+everything derived from a slice are cached per ``Filters`` signature; a slice itself is gathered from
+the (projected) shared frame on demand, and the empty signature maps to that frame.
+"""
+from typing import NamedTuple, Optional, Tuple
+import numpy as np
+import pandas as pd
+import streamlit as st
+from analysis.loader import DATA_PATH, load_games, run_version
+from analysis.page import show_stage_timings
+from analysis.profiling import stage
+
+INDEXED_COLS = ["Release Year", "Launch.Price", "Reviews.Total", "Revenue.Estimated"]
+SCAN_FRACTION = 0.1   # Above this share of rows the narrowest span is no longer selective enough to drive the plan
+
+
+class Filters(NamedTuple):
+    """Hashable filter signature; None means the predicate is not applied. Ranges are inclusive."""
+    years: Optional[Tuple[float, float]] = None
+    price: Optional[Tuple[float, float]] = None
+    reviews: Optional[Tuple[float, float]] = None
+    revenue: Optional[Tuple[float, float]] = None
+    title: Optional[str] = None
+
+    def ranges(self):
+        return [(col, rng) for col, rng in zip(INDEXED_COLS, self[:4]) if rng is not None]
+
+    @property
+    def empty(self):
+        return all(f is None for f in self)
+
+
+NO_FILTERS = Filters()
+
+
+class SortedIndex:
+    def __init__(self, values, order=None):
+        self.values = np.asarray(values, dtype=float)
+        self.order = np.argsort(self.values, kind="stable") if order is None else order
+        self.sorted = self.values[self.order]   # NaN sorts last, so it never falls inside a range
+
+    def merged(self, keep, added):
+        """Index of the kept rows (``keep``: mask over this index's rows) followed by ``added`` values.
+
+        The kept order is filtered and renumbered, and only the added values are sorted and merged in, so
+        the result equals a fresh stable argsort without sorting the whole column again.
+        """
+        added = np.asarray(added, dtype=float)
+        kept = keep[self.order]
+        renumber = np.cumsum(keep) - 1
+        n_kept = renumber[-1] + 1 if len(keep) else 0
+        added_order = np.argsort(added, kind="stable")
+        # side="right": on ties the appended rows follow the kept ones, as a stable sort would place them
+        at = np.searchsorted(self.sorted[kept], added[added_order], side="right")
+        order = np.insert(renumber[self.order[kept]], at, n_kept + added_order)
+        return SortedIndex(np.concatenate([self.values[keep], added]), order)
+
+    def span(self, lo, hi):
+        return np.searchsorted(self.sorted, lo, side="left"), np.searchsorted(self.sorted, hi, side="right")
+
+    @property
+    def bounds(self):
+        finite = self.sorted[~np.isnan(self.sorted)]
+        return (finite[0], finite[-1]) if len(finite) else (np.nan, np.nan)
+
+
+class GameIndex:
+    @stage("build index")
+    def __init__(self, df):
+        self.n = len(df)
+        self.columns = {col: SortedIndex(df[col]) for col in INDEXED_COLS}
+        self.titles = None   # (categories, codes); see set_titles
+        if 'Title' in df:
+            self.set_titles(df['Title'])
+
+    @stage("merge index")
+    def merged(self, keep, added):
+        """Index of this one's rows where ``keep`` is set followed by the rows of ``added`` (e.g. a live delta)."""
+        index = GameIndex.__new__(GameIndex)
+        index.n = int(keep.sum()) + len(added)
+        index.columns = {col: sorted_index.merged(keep, added[col]) for col, sorted_index in self.columns.items()}
+        index.titles = None   # Loaded again from the new version's frame if a title filter asks for it
+        return index
+
+    def set_titles(self, titles):
+        """Attach the Title column's dictionary; needed only by title filters."""
+        titles = titles if isinstance(titles.dtype, pd.CategoricalDtype) else titles.astype("category")
+        self.titles = titles.cat.categories, titles.cat.codes.to_numpy()   # One assignment: readers never see half of it
+
+    def title_hits(self, text):
+        """Per-category substring match; each distinct title is tested once, not once per row."""
+        hits = np.asarray(self.titles[0].str.contains(text, case=False, regex=False), dtype=bool)
+        return np.append(hits, False)   # Code -1 (missing title) indexes the trailing False
+
+    @stage("slice query")
+    def positions(self, filters):
+        """Sorted row positions matching every predicate of ``filters``."""
+        if filters.empty:
+            return np.arange(self.n)
+        spans = [(col, *self.columns[col].span(*rng)) for col, rng in filters.ranges()]
+        col, start, stop = min(spans, key=lambda s: s[2] - s[1], default=(None, 0, self.n))   # Narrowest span drives the plan
+        if stop - start > SCAN_FRACTION * self.n:
+            # Broad slice: random gathers through the sort order would cost more than a contiguous bitmap per predicate
+            mask = np.ones(self.n, dtype=bool)
+            for other, (lo, hi) in filters.ranges():
+                values = self.columns[other].values
+                mask &= (values >= lo) & (values <= hi)
+            if filters.title:
+                mask &= self.title_hits(filters.title)[self.titles[1]]
+            return np.flatnonzero(mask)
+        rows = self.columns[col].order[start:stop]
+        for other, (lo, hi) in filters.ranges():
+            if other != col:
+                values = self.columns[other].values[rows]
+                rows = rows[(values >= lo) & (values <= hi)]
+        if filters.title:
+            rows = rows[self.title_hits(filters.title)[self.titles[1][rows]]]
+        return np.sort(rows)
+
+
+def filter_mask(df, filters):
+    """Boolean mask of ``filters`` by direct comparison, for frames without an index (e.g. CSV chunks)."""
+    mask = np.ones(len(df), dtype=bool)
+    for col, (lo, hi) in filters.ranges():
+        values = df[col].to_numpy(dtype=float)
+        mask &= (values >= lo) & (values <= hi)
+    if filters.title:
+        mask &= df['Title'].astype(str).str.contains(filters.title, case=False, regex=False).to_numpy(dtype=bool)
+    return mask
+
+
+# Numeric columns only: Title is never materialised for the index unless a title filter needs it
+@st.cache_resource(show_spinner="Indexing dataset...", max_entries=4)
+def _cached_index(path, version):
+    if version[-1]:   # Live deltas applied: the running index merges them in instead of sorting again
+        from analysis.live import get_store
+        store = get_store(path, version)
+        index = store and store.index(version[-1])
+        if index is not None:
+            return index
+    return GameIndex(load_games(path, columns=INDEXED_COLS, version=version))
+
+
+def load_index(path=DATA_PATH, version=None):
+    return _cached_index(path, version or run_version(path))
+
+
+# Row positions per (dataset version, slice): 8 bytes per matching row, whatever the columns a page reads
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _cached_positions(path, version, filters):
+    index = load_index(path, version)   # Same version as the frame, whatever lands meanwhile
+    if filters.title and index.titles is None:
+        index.set_titles(load_games(path, columns=["Title"], version=version)['Title'])
+    return index.positions(filters)
+
+
+def load_positions(filters=NO_FILTERS, path=DATA_PATH, version=None):
+    return _cached_positions(path, version or run_version(path), filters)
+
+
+def load_slice(filters=NO_FILTERS, columns=None, path=DATA_PATH, version=None):
+    """Rows of the shared frame matching ``filters`` (read-only, like ``load_games``).
+
+    Only the positions are cached; the projected columns are gathered per call, so no filter signature
+    pins a copy of the frame.
+    """
+    version = version or run_version(path)
+    df = load_games(path, columns=columns, version=version)
+    if filters.empty:
+        return df   # The shared frame itself: no copy for the unfiltered view
+    with stage("gather slice"):
+        return df.iloc[load_positions(filters, path, version)].reset_index(drop=True)
+
+
+def _range_slider(label, key, bounds, integer=False):
+    if np.isnan(bounds[0]):
+        return None
+    lo, hi = (int(b) if integer else float(b) for b in bounds)
+    if not lo < hi:
+        return None
+    value = st.session_state.get(key, (lo, hi))
+    value = (max(lo, min(value[0], hi)), min(hi, max(value[1], lo)))   # Clamp a range kept from another dataset version
+    picked = st.sidebar.slider(label, lo, hi, value, key=f"_{key}")
+    st.session_state[key] = picked
+    return None if picked == (lo, hi) else picked   # Full range = no predicate, so the unfiltered caches are reused
+
+
+def sidebar_filters(path=DATA_PATH, bounds=None):
+    """Draw the shared slice controls in the sidebar and return the current ``Filters``.
+
+    Values are mirrored into session state so the slice follows the user from page to page. Slider
+    ranges come from the ``GameIndex`` unless ``bounds`` ({column: (min, max)}) is given, e.g. by a
+    streaming page that must not load the dataset.
+    """
+    if bounds is None:
+        bounds = {col: index.bounds for col, index in load_index(path).columns.items()}
+    st.sidebar.markdown("### 🔎 Slice")
+    title = st.sidebar.text_input("Title contains", st.session_state.get("filter_title", ""), key="_filter_title")
+    st.session_state["filter_title"] = title
+    return Filters(
+        years=_range_slider("Release Year", "filter_years", bounds["Release Year"], integer=True),
+        price=_range_slider("Launch Price ($)", "filter_price", bounds["Launch.Price"]),
+        reviews=_range_slider("Reviews Total", "filter_reviews", bounds["Reviews.Total"], integer=True),
+        revenue=_range_slider("Revenue Estimated ($)", "filter_revenue", bounds["Revenue.Estimated"]),
+        title=title.strip() or None,
+    )
+
+
+def require_rows(n, minimum=1):
+    """Stop the page with a notice when the slice is too small to summarise."""
+    if n < minimum:
+        st.warning(f"Only {n} game(s) match the current slice; widen the filters in the sidebar.")
+        show_stage_timings()   # Close this run's profiler and keep the toggle reachable on the stopped page
+        st.stop()
@@ -0,0 +1,89 @@
+"""Simple linear regression served from sufficient statistics.
+
+The engine keeps the merged moments of [features..., target] -- count, means and the co-moment
+matrix, i.e. centred X'X and X'y -- so every single-feature fit, covariance and correlation is a
+closed-form read, and appending rows is one partial pass over the new rows plus an exact merge.
+"""
+import numpy as np
+import streamlit as st
+from analysis.bootstrap import BOOTSTRAP_RESAMPLES, SAMPLE_CAP, bootstrap
+from analysis.filters import load_iqr_index
+from analysis.loader import DATA_PATH, run_version
+from analysis.parallel import merge_moments, parallel_moments, partial_moments
+from analysis.profiling import stage
+from analysis.query import NO_FILTERS, load_slice
+
+TARGET = "Revenue.Estimated"
+
+
+class RegressionEngine:
+    def __init__(self, columns, target=TARGET):
+        self.columns, self.target = list(columns), target
+        self.moments = {"n": 0}
+
+    @classmethod
+    def from_frame(cls, df, columns, target=TARGET, workers=None, rows=None):
+        """Build from a frame, optionally restricted to positional ``rows`` (e.g. an IQR filter index)."""
+        engine = cls(columns, target)
+        with stage("model fit"):
+            data = df[engine.columns].to_numpy(dtype=float)
+            engine.moments = parallel_moments(data if rows is None else data[rows], workers, quantiles=False)
+        return engine
+
+    def append(self, df):
+        """Fold new rows into the statistics without revisiting the old ones."""
+        self.moments = merge_moments(self.moments, partial_moments(df[self.columns].to_numpy(dtype=float), None))
+        return self
+
+    @property
+    def n(self):
+        return self.moments["n"]
+
+    def cov_matrix(self):
+        return self.moments["comoment"] / (self.n - 1)
+
+    def corr_matrix(self):
+        cov = self.cov_matrix()
+        std = np.sqrt(np.diag(cov))
+        return cov / np.outer(std, std)
+
+    def cov(self, feature, other=None):
+        return self.cov_matrix()[self.columns.index(feature), self.columns.index(other or self.target)]
+
+    def corr(self, feature, other=None):
+        return self.corr_matrix()[self.columns.index(feature), self.columns.index(other or self.target)]
+
+    def fit(self, feature):
+        """Least-squares intercept and slope (B0, B1) of target on a single feature."""
+        i, t = self.columns.index(feature), self.columns.index(self.target)
+        comoment, mean = self.moments["comoment"], self.moments["mean"]
+        b1 = comoment[i, t] / comoment[i, i]
+        return mean[t] - b1 * mean[i], b1
+
+    def feature_range(self, feature):
+        i = self.columns.index(feature)
+        return self.moments["min"][i], self.moments["max"][i]
+
+
+# Engine over the IQR-filtered rows, once per (dataset version, slice, columns, filter mode)
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _cached_regression(path, version, filters, columns, iqr_mode):
+    return RegressionEngine.from_frame(load_slice(filters, columns, path, version), columns,
+                                       rows=load_iqr_index(columns, iqr_mode, filters, path, version))
+
+
+def load_regression(columns, iqr_mode="sequential", filters=NO_FILTERS, path=DATA_PATH, version=None):
+    return _cached_regression(path, version or run_version(path), filters, tuple(columns), iqr_mode)
+
+
+# Bootstrap interval of one feature's slope, on the same IQR-filtered rows as the engine
+@st.cache_resource(show_spinner="Resampling...", max_entries=16)
+def _cached_slope_interval(path, version, filters, columns, iqr_mode, feature, resamples):
+    data = load_slice(filters, columns, path, version)[[feature, TARGET]].to_numpy(dtype=float)
+    data = data[load_iqr_index(columns, iqr_mode, filters, path, version)]
+    return bootstrap(data, [("slope", 0, 1)], resamples, sample_size=min(len(data), SAMPLE_CAP))[0]
+
+
+def load_slope_interval(columns, feature, iqr_mode="sequential", filters=NO_FILTERS, resamples=BOOTSTRAP_RESAMPLES,
+                        path=DATA_PATH, version=None):
+    return _cached_slope_interval(path, version or run_version(path), filters, tuple(columns), iqr_mode, feature, resamples)
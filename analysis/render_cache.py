@@ -0,0 +1,73 @@
+"""Process-wide LRU cache of rendered matplotlib figures.
+
+Pages call ``render_png(key, draw)``: on a hit the stored PNG bytes are served without touching
+matplotlib; on a miss ``draw()`` builds the figure, it is rendered once, closed (so nothing piles up
+in pyplot's figure manager) and stored. Keys should include the dataset version and every widget
+value the figure depends on. The cache evicts least-recently-used images above a byte cap.
+"""
+import io
+import threading
+from collections import OrderedDict
+from analysis.profiling import stage
+
+RENDER_CACHE_BYTES = 64 * 1024 * 1024
+SAVEFIG_KWARGS = {"format": "png", "bbox_inches": "tight", "dpi": 200}   # Same output as st.pyplot
+
+
+class RenderCache:
+    def __init__(self, max_bytes=RENDER_CACHE_BYTES):
+        self.max_bytes, self.nbytes = max_bytes, 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()   # Sessions rerun on separate threads
+
+    def get(self, key):
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                return self._items[key]
+        return None
+
+    def put(self, key, data):
+        with self._lock:
+            if key in self._items:
+                self.nbytes -= len(self._items.pop(key))
+            if len(data) > self.max_bytes:
+                return
+            self._items[key] = data
+            self.nbytes += len(data)
+            while self.nbytes > self.max_bytes:
+                self.nbytes -= len(self._items.popitem(last=False)[1])
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.nbytes = 0
+
+    def __len__(self):
+        return len(self._items)
+
+
+render_cache = RenderCache()
+
+
+def figure_png(fig):
+    """Render a figure to PNG bytes and close it."""
+    import matplotlib.pyplot as plt   # Already loaded by whoever built the figure
+    buf = io.BytesIO()
+    try:
+        fig.savefig(buf, **SAVEFIG_KWARGS)
+    finally:
+        plt.close(fig)
+    return buf.getvalue()
+
+
+def render_png(key, draw, cache=render_cache):
+    """Cached PNG bytes for ``key``; ``draw()`` must return a matplotlib figure and only runs on a miss."""
+    data = cache.get(key)
+    if data is None:
+        with stage("draw figure"):
+            fig = draw()
+        with stage("savefig"):
+            data = figure_png(fig)
+        cache.put(key, data)
+    return data
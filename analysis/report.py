@@ -0,0 +1,170 @@
+"""Headless batch reports: the page computations over many datasets or slices, without a browser.
+
+Each (dataset, slice) pair is one task run in a worker process; workers load every dataset once
+(through the snapshot when available) and write one JSON artifact per slice, and the run ends with a
+flat Parquet table of the scalar metrics for all slices.
+
+    python -m analysis.report games.csv --slice year --out Reports/batch --workers 8
+    python -m analysis.report exports/*.csv --slice price-band
+"""
+import os
+import sys
+import json
+import argparse
+import functools
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from analysis.aggregates import FREQUENCY_OPTIONS, price_bins, year_filter
+from analysis.binning import frequency_table
+from analysis.filters import iqr_index
+from analysis.live import read_current
+from analysis.loader import NUMERIC_COLS
+from analysis.parallel import normal_fit, partial_moments
+from analysis.regression import RegressionEngine
+from analysis.stats import describe, intervals, revenue_probabilities
+
+SLICE_KINDS = ("all", "year", "price-band")
+DEFAULT_OUT = os.path.join("Reports", "batch")
+REGRESSION_COLS = ["Reviews.Total", "Launch.Price", "Revenue.Estimated"]   # Same order as the Regression page
+
+
+@functools.lru_cache(maxsize=4)
+def _frame(path):
+    return read_current(path)   # Once per worker process and dataset, live deltas applied
+
+
+def slice_keys(df, kind):
+    if kind == "year":
+        return sorted(int(y) for y in df['Release Year'].dropna().unique())
+    if kind == "price-band":
+        # Open-ended top band so games priced at or above the last edge are not dropped
+        return [f"{lo}-{hi}" for lo, hi in zip(price_bins[:-1], price_bins[1:])] + [f"{price_bins[-1]}+"]
+    return ["all"]
+
+
+def dataset_slice_keys(path, kind):
+    """``slice_keys`` of one dataset; only year slices read it, and then only its release years."""
+    return slice_keys(read_current(path, ["Release Year"]) if kind == "year" else None, kind)
+
+
+def select_slice(df, kind, key):
+    if kind == "year":
+        return df[df['Release Year'] == key]
+    if kind == "price-band" and key.endswith("+"):
+        return df[df['Launch.Price'] >= float(key[:-1])]
+    if kind == "price-band":
+        lo, hi = (float(v) for v in key.split("-"))
+        return df[(df['Launch.Price'] >= lo) & (df['Launch.Price'] < hi)]
+    return df
+
+
+def slice_report(df):
+    """Frequency tables, descriptive stats, log-normal estimates and regression coefficients of one frame."""
+    report = {"n": len(df)}
+    if len(df) < 3:   # Too few rows for spreads, fits or an IQR filter
+        return report
+    home = year_filter(df)   # Home's frequency tables cover its release-year window only
+    report["frequency"] = {option: frequency_table(home[col].to_numpy(), step, max_val, prefix).to_dict("records")
+                           for option, (col, step, max_val, prefix) in FREQUENCY_OPTIONS.items()}
+    report["descriptive"] = {}
+    for col in NUMERIC_COLS:
+        summary = describe(df[col])
+        report["descriptive"][col] = {**summary, **intervals(summary)}
+    values = df[["Revenue.Estimated", "Launch.Price"]].to_numpy(dtype=float, copy=True)
+    values[:, 0] = np.log1p(values[:, 0])
+    moments = partial_moments(values, None)
+    mean_rev, std_rev = normal_fit(moments, 0)
+    report["distributions"] = {
+        "log_revenue_fit": {"mean": mean_rev, "std": std_rev},
+        "launch_price_fit": dict(zip(("mean", "std"), normal_fit(moments, 1))),
+        "revenue_probabilities": revenue_probabilities(mean_rev, std_rev) if std_rev > 0 else None,
+    }
+    keep = iqr_index(df, REGRESSION_COLS)
+    engine = RegressionEngine.from_frame(df, REGRESSION_COLS, workers=1, rows=keep)
+    report["regression"] = {"n_filtered": int(len(keep))}
+    with np.errstate(divide="ignore", invalid="ignore"):   # Constant features (e.g. a single price) have no slope
+        for feature in REGRESSION_COLS[:-1]:
+            b0, b1 = engine.fit(feature) if engine.n > 1 else (np.nan, np.nan)
+            report["regression"][feature] = {
+                "B0": b0, "B1": b1,
+                "cov": engine.cov(feature) if engine.n > 1 else np.nan,
+                "corr": engine.corr(feature) if engine.n > 1 else np.nan,
+            }
+    return report
+
+
+def _json_value(value):
+    if isinstance(value, (np.integer,)):
+        return int(value)
+    if isinstance(value, (np.floating, float)):
+        return float(value) if np.isfinite(value) else None
+    raise TypeError(f"not JSON serializable: {type(value).__name__}")
+
+
+def _clean(obj):
+    """NaN/inf -> None so artifacts are strict JSON."""
+    if isinstance(obj, dict):
+        return {k: _clean(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_clean(v) for v in obj]
+    if isinstance(obj, (float, np.floating)):
+        return _json_value(obj)
+    return obj
+
+
+def flatten(report, prefix=""):
+    """Scalar metrics of a report as one flat row (frequency tables are left to the JSON artifacts)."""
+    row = {}
+    for key, value in report.items():
+        if key == "frequency":
+            continue
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            row.update(flatten(value, f"{name}."))
+        elif value is None or np.isscalar(value):
+            row[name] = value
+    return row
+
+
+def run_task(path, kind, key, out_dir):
+    report = {"dataset": path, "slice": kind, "key": key,
+              **_clean(slice_report(select_slice(_frame(path), kind, key)))}
+    stem = os.path.splitext(os.path.basename(path))[0]
+    with open(os.path.join(out_dir, f"{stem}__{kind}-{key}.json"), "w") as f:
+        json.dump(report, f, indent=2, default=_json_value)
+    return flatten(report)
+
+
+def run(paths, kind="all", out_dir=DEFAULT_OUT, workers=None):
+    """Report every slice of every dataset; returns the summary frame (also written as summary.parquet)."""
+    os.makedirs(out_dir, exist_ok=True)
+    tasks = [(path, kind, key) for path in paths for key in dataset_slice_keys(path, kind)]   # Workers load the frames
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        rows = [run_task(*task, out_dir) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers, mp_context=get_context("forkserver")) as pool:
+            rows = list(pool.map(run_task, *zip(*tasks), [out_dir] * len(tasks), chunksize=max(1, len(tasks) // (workers * 4))))
+    summary = pd.DataFrame(rows)
+    try:
+        summary.to_parquet(os.path.join(out_dir, "summary.parquet"), index=False)
+    except ImportError:   # No Parquet engine installed
+        summary.to_csv(os.path.join(out_dir, "summary.csv"), index=False)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Steam games statistics reports.")
+    parser.add_argument("paths", nargs="*", default=["games.csv"], help="dataset CSV files")
+    parser.add_argument("--slice", dest="kind", choices=SLICE_KINDS, default="all")
+    parser.add_argument("--out", dest="out_dir", default=DEFAULT_OUT)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+    summary = run(args.paths, args.kind, args.out_dir, args.workers)
+    print(f"{len(summary)} slice reports written to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
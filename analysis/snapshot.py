@@ -0,0 +1,43 @@
+import os
+import json
+import tempfile
+import pyarrow as pa
+import pyarrow.feather as feather
+
+SNAPSHOT_SUFFIX = ".arrow"
+_VERSION_KEY = b"source_version"
+
+
+def snapshot_path(csv_path):
+    return os.path.splitext(csv_path)[0] + SNAPSHOT_SUFFIX
+
+
+def snapshot_version(path):
+    """Source-file version recorded in a snapshot, or None when there is no readable snapshot."""
+    try:
+        schema = feather.read_table(path, columns=[], memory_map=True).schema
+    except (OSError, pa.ArrowInvalid):
+        return None
+    meta = schema.metadata or {}
+    return tuple(json.loads(meta[_VERSION_KEY])) if _VERSION_KEY in meta else None
+
+
+def write_snapshot(df, path, source_version):
+    """Write a typed frame as an uncompressed Arrow IPC file so it can be memory mapped."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    meta = dict(table.schema.metadata or {})
+    meta[_VERSION_KEY] = json.dumps(list(source_version)).encode()
+    # A unique name in the same directory: concurrent writers never share a temp file, and the rename is atomic
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=os.path.dirname(path) or ".")
+    os.close(fd)
+    try:
+        feather.write_feather(table.replace_schema_metadata(meta), tmp, compression="uncompressed")
+        os.replace(tmp, path)   # Readers never see a half-written snapshot
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def read_snapshot(path, columns=None):
+    """Memory-mapped read; only the projected columns are materialised."""
+    return feather.read_table(path, columns=columns, memory_map=True).to_pandas()
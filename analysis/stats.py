@@ -0,0 +1,37 @@
+import numpy as np
+from statistics import NormalDist
+
+
+def describe(values):
+    """Exact descriptive summary of a numeric column (NaNs ignored)."""
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+    return {
+        "n": len(values), "mean": values.mean(), "var": values.var(ddof=1), "std": values.std(ddof=1),
+        "min": values.min(), "max": values.max(), "q1": q1, "median": median, "q3": q3,
+    }
+
+
+def intervals(summary, confidence=0.95):
+    """Confidence interval for the mean, 3-sigma interval and Tukey outlier fences of a ``describe`` summary."""
+    mean, std = summary["mean"], summary["std"]
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    se = std / (summary["n"] ** 0.5)
+    iqr = summary["q3"] - summary["q1"]
+    return {
+        "iqr": iqr, "ci_lower": mean - z * se, "ci_upper": mean + z * se,
+        "lower_3sd": mean - 3 * std, "upper_3sd": mean + 3 * std,
+        "lower_out": summary["q1"] - 1.5 * iqr, "upper_out": summary["q3"] + 1.5 * iqr,
+    }
+
+
+def revenue_probabilities(mean, std):
+    """Revenue probability estimates from a normal fit (mean, std) on log(1 + revenue)."""
+    dist = NormalDist(mean, std)
+    p1 = dist.cdf(np.log1p(1_000_000))
+    return {
+        "p_below_1m": p1,
+        "p_above_1m": 1 - p1,
+        "p_2_5m_to_7_5m": dist.cdf(np.log1p(7_500_000)) - dist.cdf(np.log1p(2_500_000)),
+    }
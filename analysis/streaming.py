@@ -0,0 +1,198 @@
+"""One-pass, mergeable statistics for CSVs too large to hold in memory.
+
+Moments (count, mean, variance, min, max) are exact up to floating-point rounding: each chunk is
+summarised with NumPy and folded in with Chan et al.'s parallel update. Quantiles come from a
+DDSketch-style log-bucket sketch: every quantile it returns is within ``rel_err`` relative error of
+the exact order statistic at rank floor(q * (n - 1)), whatever the data size or chunking. Sketches
+from different chunks (or processes) merge exactly, so the result does not depend on chunk size.
+"""
+import math
+import numpy as np
+import pandas as pd
+import streamlit as st
+from analysis.loader import DATA_PATH, NUMERIC_COLS, run_version
+from analysis.profiling import stage
+from analysis.query import INDEXED_COLS, NO_FILTERS, filter_mask
+
+CHUNK_ROWS = 1_000_000
+STREAMING_MIN_BYTES = 1 << 30   # Files above this default to streaming mode
+REL_ERR = 0.005
+
+
+class Moments:
+    """Running count, mean, sum of squared deviations (M2), min and max."""
+
+    def __init__(self):
+        self.n, self.mean, self.m2 = 0, 0.0, 0.0
+        self.min, self.max = math.inf, -math.inf
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        if len(values) == 0:
+            return self
+        part = Moments()
+        part.n, part.mean = len(values), values.mean()
+        part.m2 = ((values - part.mean) ** 2).sum()
+        part.min, part.max = values.min(), values.max()
+        return self.merge(part)
+
+    def merge(self, other):
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta ** 2 * self.n * other.n / n
+        self.n = n
+        self.min, self.max = min(self.min, other.min), max(self.max, other.max)
+        return self
+
+    @property
+    def var(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else math.nan
+
+    @property
+    def std(self):
+        return math.sqrt(self.var)
+
+
+class QuantileSketch:
+    """Mergeable log-bucket quantile sketch with a relative-error guarantee (see module docstring)."""
+
+    def __init__(self, rel_err=REL_ERR, min_value=1e-9):
+        self.rel_err, self.min_value = rel_err, min_value
+        self.gamma = (1 + rel_err) / (1 - rel_err)
+        self._log_gamma = math.log(self.gamma)
+        self.pos, self.neg, self.zero, self.n = {}, {}, 0, 0
+
+    def _add(self, store, magnitudes):
+        if len(magnitudes) == 0:
+            return
+        keys = np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+        low = keys.min()
+        counts = np.bincount(keys - low)   # Keys span a few thousand buckets at most, so no sort is needed
+        for k in np.flatnonzero(counts).tolist():
+            store[k + int(low)] = store.get(k + int(low), 0) + int(counts[k])
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        self._add(self.pos, values[values > self.min_value])
+        self._add(self.neg, -values[values < -self.min_value])
+        self.zero += int((np.abs(values) <= self.min_value).sum())
+        self.n += len(values)
+        return self
+
+    def merge(self, other):
+        for mine, theirs in ((self.pos, other.pos), (self.neg, other.neg)):
+            for k, c in theirs.items():
+                mine[k] = mine.get(k, 0) + c
+        self.zero += other.zero
+        self.n += other.n
+        return self
+
+    def buckets(self):
+        """Ascending (representative value, count) arrays, one entry per non-empty bucket."""
+        rep = lambda keys: 2 * self.gamma ** np.asarray(keys, dtype=float) / (self.gamma + 1)
+        neg_keys, pos_keys = sorted(self.neg, reverse=True), sorted(self.pos)
+        values = np.concatenate([-rep(neg_keys), [0.0] if self.zero else [], rep(pos_keys)])
+        counts = np.array([self.neg[k] for k in neg_keys] + ([self.zero] if self.zero else []) +
+                          [self.pos[k] for k in pos_keys], dtype=np.int64)
+        return values, counts
+
+    def quantile(self, q):
+        if self.n == 0:
+            return math.nan
+        values, counts = self.buckets()
+        rank = math.floor(q * (self.n - 1))
+        return values[np.searchsorted(np.cumsum(counts), rank, side='right')]
+
+
+def box_stats(summary, sketch, label, show_fliers=False):
+    """matplotlib ``bxp`` statistics drawn from a summary and its sketch instead of raw values."""
+    iqr = summary["q3"] - summary["q1"]
+    lo, hi = summary["q1"] - 1.5 * iqr, summary["q3"] + 1.5 * iqr
+    values, _ = sketch.buckets()
+    inside = values[(values >= lo) & (values <= hi)]
+    return {
+        "label": label, "med": summary["median"], "q1": summary["q1"], "q3": summary["q3"],
+        "whislo": max(summary["min"], inside.min()) if len(inside) else summary["q1"],
+        "whishi": min(summary["max"], inside.max()) if len(inside) else summary["q3"],
+        # One representative point per outlying bucket keeps the flier count bounded
+        "fliers": values[(values < lo) | (values > hi)] if show_fliers else [],
+    }
+
+
+@stage("stream describe")
+def stream_describe(path, column, chunk_rows=CHUNK_ROWS, rel_err=REL_ERR, filters=NO_FILTERS, version=None):
+    """Same keys as ``analysis.stats.describe``, reading the CSV one chunk at a time; also returns the sketch.
+
+    ``version`` (a ``dataset_version``) limits the live deltas to those applied at it; default: all of them.
+    """
+    from analysis.live import key_hashes, read_deltas
+    moments, sketch = Moments(), QuantileSketch(rel_err)
+    deltas = read_deltas(path, version)   # Live upserts: base rows they replace are skipped, then the deltas are added
+    keyed = not filters.empty or deltas is not None
+    wanted = NUMERIC_COLS + (["Release.Date", "Title"] if keyed else [])   # Key columns only when needed
+    replaced = key_hashes(deltas) if deltas is not None else None
+    for chunk in pd.read_csv(path, usecols=lambda c: c.strip() in wanted, chunksize=chunk_rows):
+        chunk.columns = chunk.columns.str.strip()
+        chunk[NUMERIC_COLS] = chunk[NUMERIC_COLS].apply(pd.to_numeric, errors='coerce')
+        chunk = chunk.dropna(subset=NUMERIC_COLS)   # Same row filter as the in-memory loader
+        if keyed:
+            chunk['Release.Date'] = pd.to_datetime(chunk['Release.Date'], errors='coerce')
+            chunk['Release Year'] = chunk['Release.Date'].dt.year
+        if replaced is not None:
+            chunk = chunk[~np.isin(key_hashes(chunk), replaced)]
+        if not filters.empty:
+            chunk = chunk[filter_mask(chunk, filters)]
+        values = chunk[column].to_numpy(dtype=float)
+        moments.update(values)
+        sketch.update(values)
+    if deltas is not None:
+        values = (deltas if filters.empty else deltas[filter_mask(deltas, filters)])[column].to_numpy(dtype=float)
+        moments.update(values)
+        sketch.update(values)
+    summary = {"n": moments.n, "mean": moments.mean, "var": moments.var, "std": moments.std,
+               "min": moments.min, "max": moments.max,
+               "q1": sketch.quantile(0.25), "median": sketch.quantile(0.5), "q3": sketch.quantile(0.75)}
+    return summary, sketch
+
+
+@st.cache_resource(show_spinner="Streaming dataset...", max_entries=16)
+def _cached_stream_describe(path, version, filters, column):
+    return stream_describe(path, column, filters=filters, version=version)
+
+
+def load_stream_describe(column, filters=NO_FILTERS, path=DATA_PATH, version=None):
+    return _cached_stream_describe(path, version or run_version(path), filters, column)
+
+
+@stage("stream bounds")
+def stream_bounds(path, chunk_rows=CHUNK_ROWS, version=None):
+    """(min, max) of every sliceable column in one chunked pass: slider ranges without loading or indexing the data."""
+    lo, hi = dict.fromkeys(INDEXED_COLS, np.inf), dict.fromkeys(INDEXED_COLS, -np.inf)
+    wanted = NUMERIC_COLS + ["Release.Date"]
+    chunks = pd.read_csv(path, usecols=lambda c: c.strip() in wanted, chunksize=chunk_rows)
+    from analysis.live import read_deltas
+    deltas = read_deltas(path, version)   # Rows the deltas replace are still counted; at worst a range is slightly wide
+    for chunk in (chunks if deltas is None else [*chunks, deltas]):
+        chunk.columns = chunk.columns.str.strip()
+        chunk[NUMERIC_COLS] = chunk[NUMERIC_COLS].apply(pd.to_numeric, errors='coerce')
+        chunk = chunk.dropna(subset=NUMERIC_COLS)
+        chunk['Release Year'] = pd.to_datetime(chunk['Release.Date'], errors='coerce').dt.year
+        for col in INDEXED_COLS:
+            values = chunk[col].to_numpy(dtype=float)
+            values = values[~np.isnan(values)]
+            if len(values):
+                lo[col], hi[col] = min(lo[col], values.min()), max(hi[col], values.max())
+    return {col: (lo[col], hi[col]) if lo[col] <= hi[col] else (np.nan, np.nan) for col in INDEXED_COLS}
+
+
+@st.cache_resource(show_spinner="Streaming dataset...", max_entries=4)
+def _cached_stream_bounds(path, version):
+    return stream_bounds(path, version=version)
+
+
+def load_stream_bounds(path=DATA_PATH, version=None):
+    return _cached_stream_bounds(path, version or run_version(path))
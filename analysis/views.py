@@ -0,0 +1,140 @@
+"""The computations behind each page, one function per timed stage.
+
+The pages call these between their widgets, and ``benchmarks.bench_stages`` calls the same functions
+in a fresh interpreter (cold caches), so the stage names and the work timed are the page's own.
+Plotting libraries load only when a figure is actually drawn (see ``analysis.charts``).
+"""
+import numpy as np
+import pandas as pd
+from analysis.aggregates import FREQUENCY_OPTIONS, load_cube, load_frequency_table, year_filter
+from analysis.bootstrap import load_bootstrap
+from analysis.charts import box_plot_figure, correlation_figure, normal_fit_figure, regression_figure
+from analysis.filters import load_iqr_index
+from analysis.loader import DATA_PATH, run_version
+from analysis.parallel import load_moments, normal_fit, summarize
+from analysis.profiling import stage
+from analysis.query import NO_FILTERS, load_slice
+from analysis.regression import load_regression, load_slope_interval
+from analysis.render_cache import render_png
+from analysis.streaming import box_stats, load_stream_describe
+
+DESCRIPTIVE_COLS = ["Revenue.Estimated", "Reviews.Total", "Launch.Price"]
+DISTRIBUTION_COLS = ["Revenue.Estimated", "Launch.Price"]
+REVENUE_BANDS = [("P(Revenue < `$1.00M`)", -np.inf, 1e6), ("P(Revenue > `$1.00M`)", 1e6, np.inf),
+                 ("P(`$2.50M` < Revenue < `$7.50M`)", 2.5e6, 7.5e6)]
+
+
+# Home
+
+@stage("load")
+def home_games(filters=NO_FILTERS, path=DATA_PATH):
+    return year_filter(load_slice(filters, path=path))   # A new frame; the shared one is untouched
+
+
+@stage("aggregates")
+def home_cube(filters=NO_FILTERS, path=DATA_PATH):
+    return load_cube(filters, path)   # Bar/line chart aggregates, built once per dataset version and slice
+
+
+@stage("frequency table")
+def home_frequency(option, filters=NO_FILTERS, path=DATA_PATH):
+    column, step, max_val, prefix = FREQUENCY_OPTIONS[option]
+    return load_frequency_table(column, step, max_val, prefix, filters, path)   # Cached per spec
+
+
+@stage("top 10")
+def top_games(df, column, ascending=False):
+    return df.sort_values(by=column, ascending=ascending).head(10)
+
+
+# Descriptive
+
+@stage("summary")
+def descriptive_summary(column, filters=NO_FILTERS, streaming=False, path=DATA_PATH):
+    """(summary, sketch, values): sketch only in streaming mode, raw values only in memory."""
+    if streaming:
+        summary, sketch = load_stream_describe(column, filters, path)   # Never holds more than one chunk
+        return summary, sketch, None
+    df = load_slice(filters, columns=DESCRIPTIVE_COLS, path=path)   # Only the numeric columns are materialised
+    if df.empty:
+        return {"n": 0}, None, df[column]
+    moments = load_moments([column], filters=filters, path=path)   # Partitioned across worker processes on large data
+    return summarize(moments, [column])["columns"][column], None, df[column]
+
+
+@stage("bootstrap intervals")
+def descriptive_intervals(column, filters=NO_FILTERS, path=DATA_PATH):
+    return load_bootstrap([column], [("mean", 0), ("median", 0), ("iqr", 0)], filters=filters, path=path)
+
+
+@stage("box plot")
+def box_plot_png(label, summary, sketch, values, show_outliers=False, filters=NO_FILTERS, path=DATA_PATH):
+    def draw():
+        stats = box_stats(summary, sketch, "", show_outliers) if sketch is not None else None
+        return box_plot_figure(label, show_outliers, values=values, stats=stats)
+    # Rendered once per (dataset version, slice, variable, mode, outliers); toggling back serves cached bytes
+    return render_png(("Descriptive", run_version(path), filters, label, sketch is not None, show_outliers), draw)
+
+
+# Distributions
+
+@stage("load")
+def distribution_games(filters=NO_FILTERS, path=DATA_PATH):
+    return load_slice(filters, columns=DISTRIBUTION_COLS, path=path)
+
+
+@stage("normal fits")
+def normal_fits(filters=NO_FILTERS, path=DATA_PATH):
+    """(mean, std) of log revenue and of launch price, from merged partition statistics."""
+    moments = load_moments(DISTRIBUTION_COLS, log1p=["Revenue.Estimated"], filters=filters, path=path, running=True)
+    return normal_fit(moments, 0), normal_fit(moments, 1)
+
+
+def normal_fit_png(data, fit, title, label, filters=NO_FILTERS, path=DATA_PATH):
+    with stage(f"figure: {label}"):
+        return render_png(("Distributions", run_version(path), filters, title),
+                          lambda: normal_fit_figure(data, fit, title, label))
+
+
+@stage("empirical bands")
+def revenue_bands(filters=NO_FILTERS, path=DATA_PATH):
+    return load_bootstrap(["Revenue.Estimated"], [("band", 0, lo, hi) for _, lo, hi in REVENUE_BANDS],
+                          filters=filters, path=path)
+
+
+# Regression
+
+@stage("load")
+def regression_games(features, filters=NO_FILTERS, path=DATA_PATH):
+    return load_slice(filters, columns=features, path=path)   # Row positions from ``regression_rows`` refer to this slice
+
+
+@stage("IQR filter")
+def regression_rows(features, iqr_mode="sequential", filters=NO_FILTERS, path=DATA_PATH):
+    return load_iqr_index(features, iqr_mode, filters, path)
+
+
+@stage("model fit")
+def regression_engine(features, iqr_mode="sequential", filters=NO_FILTERS, path=DATA_PATH):
+    return load_regression(features, iqr_mode, filters, path)
+
+
+@stage("scatter")
+def scatter_png(df, keep, engine, feature, label, point_budget, iqr_mode="sequential", filters=NO_FILTERS,
+                path=DATA_PATH):
+    def draw():
+        X, y = df[feature].to_numpy()[keep], df["Revenue.Estimated"].to_numpy()[keep]
+        return regression_figure(X, y, engine.feature_range(feature), engine.fit(feature), label, point_budget)
+    return render_png(("Regression scatter", run_version(path), filters, iqr_mode, feature, point_budget), draw)
+
+
+@stage("correlation matrix")
+def correlation_png(engine, features, iqr_mode="sequential", filters=NO_FILTERS, path=DATA_PATH):
+    corr_matrix = pd.DataFrame(engine.corr_matrix(), index=features, columns=features)
+    return render_png(("Regression correlation", run_version(path), filters, iqr_mode),
+                      lambda: correlation_figure(corr_matrix, features))
+
+
+@stage("slope interval")
+def slope_interval(features, feature, iqr_mode="sequential", filters=NO_FILTERS, path=DATA_PATH):
+    return load_slope_interval(features, feature, iqr_mode, filters, path=path)   # Pairs bootstrap over the IQR-filtered rows
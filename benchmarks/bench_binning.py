@@ -0,0 +1,54 @@
+"""Frequency tables: the old pd.cut + column mutation vs the searchsorted/bincount engine.
+
+    python -m benchmarks.bench_binning 10000 1000000 10000000
+"""
+import sys
+import time
+import numpy as np
+import pandas as pd
+from analysis.binning import frequency_table
+from benchmarks.synthetic import make_games
+
+SPECS = [("Launch.Price", 10, 60, "$"), ("Reviews.Total", 50000, 300000, ""), ("Revenue.Estimated", 1500000, 9000000, "$")]
+
+
+def legacy_frequency_table(df, column, step, max_val, prefix="$"):
+    """The original Home.py display_distribution body, minus the Streamlit output."""
+    def fmt(val): return f"{prefix}{val / 1_000_000:.1f}M" if val >= 1e6 else f"{prefix}{val / 1_000:.0f}K" if val >= 1e3 else f"{prefix}{val}"
+    bins = list(range(0, max_val + step, step)) + [np.inf]
+    labels = [f"{fmt(bins[i])} - {fmt(bins[i+1])}" for i in range(len(bins)-2)] + [f">{fmt(max_val)}"]
+    col_name_pretty = column.replace(".", " ")
+    df[col_name_pretty] = pd.cut(df[column], bins=bins, labels=labels, right=False)
+    freq = df[col_name_pretty].value_counts().sort_index()
+    return pd.DataFrame({
+        "Range": freq.index.astype(str),
+        "Frequency": freq.values,
+        "Cumulative Frequency": freq.cumsum().values,
+        "Relative Frequency (%)": (freq / freq.sum() * 100).round(2)
+    })
+
+
+def best_of(fn, repeat=3):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return min(times)
+
+
+def main(sizes):
+    for n in sizes:
+        df = make_games(n).drop(columns=["Title", "Release.Date"])
+        print(f"\n{n:,} rows")
+        for column, step, max_val, prefix in SPECS:
+            old = legacy_frequency_table(df, column, step, max_val, prefix)
+            new = frequency_table(df[column].to_numpy(), step, max_val, prefix)
+            assert (old["Frequency"].to_numpy() == new["Frequency"].to_numpy()).all(), column
+            t_old = best_of(lambda: legacy_frequency_table(df, column, step, max_val, prefix))
+            t_new = best_of(lambda: frequency_table(df[column].to_numpy(), step, max_val, prefix))
+            print(f"  {column:<18} pd.cut {t_old * 1e3:9.2f} ms   engine {t_new * 1e3:9.2f} ms   x{t_old / t_new:6.1f}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 1_000_000, 10_000_000])
@@ -0,0 +1,46 @@
+"""Bootstrap throughput: order-statistic specs at full size, gathered specs with worker count, plus seeding and interval checks.
+
+    python -m benchmarks.bench_bootstrap 1000000 100000 10000
+"""
+import sys
+import time
+import numpy as np
+from analysis.bootstrap import ORDER_KINDS, bootstrap, replicates
+from analysis.parallel import get_pool
+from benchmarks.synthetic import make_games
+
+COLUMNS = ["Reviews.Total", "Revenue.Estimated"]
+SPECS = [("mean", 1), ("median", 1), ("iqr", 1), ("slope", 0, 1), ("band", 1, -np.inf, 1e6), ("band", 1, 2.5e6, 7.5e6)]
+ORDER_SPECS = [spec for spec in SPECS if spec[0] in ORDER_KINDS]
+GATHERED_SPECS = [spec for spec in SPECS if spec[0] not in ORDER_KINDS]
+
+
+def main(n_rows, resamples, sample_size, worker_counts=(1, 2, 4, 8)):
+    data = make_games(n_rows)[COLUMNS].to_numpy(dtype=float)
+    # Chunks carry their own seeds, so the replicates do not depend on how the work is spread
+    small = data[:10_000]
+    assert np.array_equal(replicates(small, SPECS, 500, workers=1), replicates(small, SPECS, 500, workers=2, min_cells=0))
+    # The bootstrap standard error of the mean must match sigma / sqrt(n), with and without m-out-of-n scaling
+    analytic = data[:, 1].std(ddof=1) / np.sqrt(n_rows)
+    for m in (n_rows, sample_size):
+        se = bootstrap(data, SPECS[:1], 1000, sample_size=m, workers=1)[0]["se"]
+        assert abs(se / analytic - 1) < 0.1, f"m={m}: bootstrap se {se:.4g} vs analytic {analytic:.4g}"
+    t = time.perf_counter()
+    bootstrap(data, ORDER_SPECS, resamples)
+    print(f"{n_rows:,} rows: {resamples:,} full-size resamples of median, IQR and 2 bands  "
+          f"{time.perf_counter() - t:7.2f} s")
+    print(f"{resamples:,} resamples of {sample_size:,} rows, mean and slope")
+    base = None
+    for workers in worker_counts:
+        if workers > 1:
+            list(get_pool(workers).map(abs, range(workers)))   # Start the pool outside the timing
+        t = time.perf_counter()
+        bootstrap(data, GATHERED_SPECS, resamples, sample_size=sample_size, workers=workers)
+        elapsed = time.perf_counter() - t
+        base = base or elapsed
+        print(f"  {workers} workers  {elapsed:7.2f} s  speedup x{base / elapsed:4.2f}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(*(args + [1_000_000, 100_000, 10_000][len(args):]))
@@ -0,0 +1,63 @@
+"""Chart payload and render time before/after server-side binning and scatter downsampling.
+
+    python -m benchmarks.bench_charts 1000000
+"""
+import io
+import sys
+import time
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import plotly.express as px
+import seaborn as sns
+from analysis.charts import draw_histogram, histogram_bars, plotly_histogram, stratified_sample
+from benchmarks.synthetic import make_games
+
+
+def timed(fn):
+    t = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t
+
+
+def plotly_payload(build):
+    fig, t = timed(lambda: build().to_json())
+    return len(fig), t
+
+
+def png_render(draw):
+    def render():
+        fig, ax = plt.subplots(figsize=(10, 6))
+        draw(ax)
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png")
+        plt.close(fig)
+        return buf.getbuffer().nbytes
+    return timed(render)
+
+
+def row(name, size, seconds, unit="bytes"):
+    print(f"  {name:<40} {size:>14,} {unit}  {seconds * 1e3:10.1f} ms")
+
+
+def main(n_rows):
+    df = make_games(n_rows)
+    log_rev = np.log(df["Revenue.Estimated"] + 1)
+    print(f"{n_rows:,} rows")
+    print("Home histogram (plotly JSON sent to the browser)")
+    row("px.histogram on raw values", *plotly_payload(lambda: px.histogram(x=log_rev, nbins=50)))
+    row("pre-binned bars", *plotly_payload(lambda: plotly_histogram(*histogram_bars(log_rev, bins=50))))
+    print("Distributions histogram (PNG)")
+    row("sns.histplot on raw values", *png_render(lambda ax: sns.histplot(log_rev, bins=50, stat="density", ax=ax)))
+    row("pre-binned bars", *png_render(lambda ax: draw_histogram(ax, *histogram_bars(log_rev, bins=50, density=True), "#007bb3")))
+    print("Regression scatter (PNG)")
+    x, y = df["Reviews.Total"].to_numpy(float), df["Revenue.Estimated"].to_numpy(float)
+    row("every point", *png_render(lambda ax: ax.scatter(x, y, alpha=0.5)))
+    shown, t_sample = timed(lambda: stratified_sample(x, y))
+    size, t_draw = png_render(lambda ax: ax.scatter(x[shown], y[shown], alpha=0.5))
+    row(f"stratified sample ({len(shown):,} points)", size, t_sample + t_draw)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,42 @@
+"""IQR filtering: the old per-column copy loop vs the single-mask filter in both modes.
+
+    python -m benchmarks.bench_filters 5000000
+"""
+import sys
+import time
+import numpy as np
+from analysis.filters import iqr_index
+from benchmarks.synthetic import make_games
+
+COLUMNS = ["Reviews.Total", "Launch.Price", "Revenue.Estimated"]
+
+
+def legacy_iqr_filter(data, cols):
+    """The original pages/Regression.py implementation."""
+    for col in cols:
+        Q1, Q3 = data[col].quantile([0.25, 0.75])
+        IQR = Q3 - Q1
+        data = data[(data[col] >= Q1 - 1.5 * IQR) & (data[col] <= Q3 + 1.5 * IQR)]
+    return data
+
+
+def timed(fn):
+    t = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t
+
+
+def main(n_rows):
+    df = make_games(n_rows)[COLUMNS]
+    legacy, t_legacy = timed(lambda: legacy_iqr_filter(df.copy(), COLUMNS))
+    sequential, t_seq = timed(lambda: iqr_index(df, COLUMNS, "sequential"))
+    joint, t_joint = timed(lambda: iqr_index(df, COLUMNS, "joint"))
+    assert np.array_equal(sequential, legacy.index.to_numpy()), "sequential mode must keep the same rows"
+    print(f"{n_rows:,} rows")
+    print(f"  legacy copy loop   {t_legacy * 1e3:9.1f} ms  kept {len(legacy):,}")
+    print(f"  sequential mask    {t_seq * 1e3:9.1f} ms  kept {len(sequential):,}")
+    print(f"  joint mask         {t_joint * 1e3:9.1f} ms  kept {len(joint):,}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000)
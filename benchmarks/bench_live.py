@@ -0,0 +1,79 @@
+"""Live deltas: ingest latency per delta size vs a full reload, checked against a from-scratch rebuild.
+
+    python -m benchmarks.bench_live 1000000
+"""
+import os
+import sys
+import time
+import tempfile
+import numpy as np
+import pandas as pd
+from analysis import live
+from analysis.aggregates import additive_cube, build_cube, year_filter
+from analysis.loader import parse_games
+from analysis.parallel import frame_moments
+from benchmarks.synthetic import make_games
+
+DELTA_SIZES = [100, 1_000, 10_000, 100_000]
+MOMENT_COLS = ["Revenue.Estimated", "Launch.Price"]
+
+
+def make_delta(base, size, seed):
+    """Half updates of existing rows, half new titles."""
+    rng = np.random.default_rng(seed)
+    updates = base.iloc[rng.choice(len(base), size // 2, replace=False)].copy()
+    updates["Revenue.Estimated"] = np.round(updates["Revenue.Estimated"] * rng.uniform(0.5, 2.0, len(updates)), 2)
+    new = make_games(size - len(updates), seed)
+    new["Title"] = new["Title"] + f" (delta {seed})"
+    return pd.concat([updates, new], ignore_index=True)
+
+
+def main(n_rows):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "games.csv")
+        base = make_games(n_rows)
+        base.to_csv(path, index=False)
+        t = time.perf_counter()
+        full = parse_games(path)
+        build_cube(year_filter(full))
+        frame_moments(full, MOMENT_COLS, ["Revenue.Estimated"])
+        t_full = time.perf_counter() - t
+        t = time.perf_counter()
+        store = live.LiveStore(path)
+        store.cube(0)
+        store.moments(MOMENT_COLS, ("Revenue.Estimated",), 0)
+        store.index(0)
+        print(f"{n_rows:,} base rows: full reload + aggregates {t_full * 1e3:.0f} ms, "
+              f"live store setup {(time.perf_counter() - t) * 1e3:.0f} ms (once per base file)")
+        os.makedirs(live.delta_dir(path))
+        for seed, size in enumerate(DELTA_SIZES, start=1):
+            make_delta(base, size, seed).to_csv(os.path.join(live.delta_dir(path), f"{seed:04d}.csv"), index=False)
+            t = time.perf_counter()
+            store.refresh()
+            t_ingest = time.perf_counter() - t
+            store.frame(seq=store.seq)   # What the first page run at the new version assembles
+            t_frame = time.perf_counter() - t - t_ingest
+            print(f"  delta {size:>7,} rows   ingest {t_ingest * 1e3:8.1f} ms   frame {t_frame * 1e3:7.1f} ms   "
+                  f"{(t_ingest + t_frame) / t_full:6.1%} of a full reload")
+
+        # The incremental state must equal a rebuild from the base plus every delta, last row per key winning
+        expected = pd.concat([parse_games(path)] + [parse_games(os.path.join(live.delta_dir(path), name))
+                                                    for name in live.delta_files(path)], ignore_index=True)
+        expected["Title"] = expected["Title"].astype(str)
+        expected = expected[~expected.duplicated(["Title", "Release.Date"], keep="last")].reset_index(drop=True)
+        got = store.frame()
+        got["Title"] = got["Title"].astype(str)
+        pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+        cube, rebuilt = store.cube(store.seq), additive_cube(year_filter(expected))
+        for key, value in rebuilt.items():
+            a, b = (value[1], cube[key][1]) if isinstance(value, tuple) else (value.to_numpy(), cube[key].to_numpy())
+            assert np.allclose(a, b), f"{key}: running aggregate must match a rebuild"
+        moments = store.moments(MOMENT_COLS, ("Revenue.Estimated",), store.seq)
+        rebuilt = frame_moments(expected, MOMENT_COLS, ["Revenue.Estimated"])
+        assert moments["n"] == rebuilt["n"] and np.allclose(moments["mean"], rebuilt["mean"])
+        assert np.allclose(moments["comoment"], rebuilt["comoment"], rtol=1e-6)
+        print(f"  {len(expected):,} live rows: frame, aggregates and moments match a rebuild")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
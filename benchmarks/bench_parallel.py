@@ -0,0 +1,31 @@
+"""Scaling of the partition-and-merge statistics with worker count (exactness is checked in tests/test_parallel.py).
+
+    python -m benchmarks.bench_parallel 10000000
+"""
+import sys
+import time
+import numpy as np
+from analysis.parallel import get_pool, parallel_moments, summarize
+from benchmarks.synthetic import make_games
+
+COLUMNS = ["Launch.Price", "Reviews.Total", "Revenue.Estimated"]
+
+
+def main(n_rows, worker_counts=(1, 2, 4, 8)):
+    data = make_games(n_rows)[COLUMNS].to_numpy(dtype=float)
+    reference = summarize(parallel_moments(data, workers=1), COLUMNS)
+    print(f"{n_rows:,} rows x {len(COLUMNS)} columns")
+    base = None
+    for workers in worker_counts:
+        if workers > 1:
+            list(get_pool(workers).map(abs, range(workers)))   # Start the pool outside the timing
+        t = time.perf_counter()
+        result = summarize(parallel_moments(data, workers=workers, min_rows=0), COLUMNS)
+        elapsed = time.perf_counter() - t
+        base = base or elapsed
+        err = np.abs(result["cov"] / reference["cov"] - 1).max()
+        print(f"  {workers} workers  {elapsed:7.3f} s  speedup x{base / elapsed:4.2f}  max cov rel. diff {err:.1e}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
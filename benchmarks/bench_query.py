@@ -0,0 +1,44 @@
+"""Slice queries: sorted-index plan vs a full-scan mask over every predicate.
+
+    python -m benchmarks.bench_query 5000000
+"""
+import sys
+import time
+import numpy as np
+import pandas as pd
+from analysis.query import Filters, GameIndex, filter_mask
+from benchmarks.synthetic import make_games
+
+QUERIES = {
+    "one year": Filters(years=(2015, 2015)),
+    "price band": Filters(price=(20.0, 30.0)),
+    "narrow reviews + year": Filters(years=(2000, 2020), reviews=(100000, 150000)),
+    "all four ranges": Filters(years=(2010, 2020), price=(10.0, 40.0), reviews=(5000, 50000), revenue=(1e5, 1e6)),
+    "title only": Filters(title="game 1234"),
+}
+
+
+def timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t)
+    return result, best
+
+
+def main(n_rows):
+    df = make_games(n_rows)
+    df["Title"] = df["Title"].astype("category")
+    df["Release Year"] = pd.to_datetime(df["Release.Date"]).dt.year
+    index, t_build = timed(lambda: GameIndex(df), repeat=1)
+    print(f"{n_rows:,} rows, index built in {t_build * 1e3:.1f} ms")
+    for name, filters in QUERIES.items():
+        rows, t_index = timed(lambda: index.positions(filters))
+        scan, t_scan = timed(lambda: np.flatnonzero(filter_mask(df, filters)))
+        assert np.array_equal(rows, scan), f"{name}: index plan must select the same rows as the scan"
+        print(f"  {name:<24} index {t_index * 1e3:8.1f} ms   scan {t_scan * 1e3:8.1f} ms   rows {len(rows):,}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000)
@@ -0,0 +1,57 @@
+"""Sufficient-statistics regression vs refitting sklearn, including daily-style appends.
+
+Checks B0/B1, covariance and correlation against sklearn/NumPy before timing anything.
+
+    python -m benchmarks.bench_regression 1000000 10000
+"""
+import sys
+import time
+import numpy as np
+from sklearn.linear_model import LinearRegression
+from analysis.regression import RegressionEngine
+from benchmarks.synthetic import make_games
+
+COLUMNS = ["Reviews.Total", "Launch.Price", "Revenue.Estimated"]
+
+
+def check(engine, df):
+    for feature in COLUMNS[:-1]:
+        model = LinearRegression().fit(df[[feature]], df["Revenue.Estimated"])
+        b0, b1 = engine.fit(feature)
+        scale = abs(df["Revenue.Estimated"].mean())   # B0 is a difference of large means, so compare it on the target's scale
+        assert np.isclose(b0, model.intercept_, rtol=1e-9, atol=1e-9 * scale), feature
+        assert np.isclose(b1, model.coef_[0], rtol=1e-9), feature
+        assert np.isclose(engine.cov(feature), np.cov(df[feature], df["Revenue.Estimated"])[0, 1], rtol=1e-9)
+        assert np.isclose(engine.corr(feature), df[feature].corr(df["Revenue.Estimated"]), rtol=1e-9)
+
+
+def main(n_rows, delta_rows):
+    df = make_games(n_rows + delta_rows)[COLUMNS]
+    base, delta = df.iloc[:n_rows], df.iloc[n_rows:]
+    engine = RegressionEngine.from_frame(base, COLUMNS)
+    check(engine, base)
+    engine.append(delta)
+    check(engine, df)
+    print(f"{n_rows:,} rows + {delta_rows:,} appended: B0/B1, cov and corr match sklearn/NumPy")
+
+    t = time.perf_counter()
+    LinearRegression().fit(df[[COLUMNS[0]]], df["Revenue.Estimated"])
+    t_sklearn = time.perf_counter() - t
+    t = time.perf_counter()
+    RegressionEngine.from_frame(df, COLUMNS, workers=1)
+    t_build = time.perf_counter() - t
+    t = time.perf_counter()
+    engine.append(delta)
+    t_append = time.perf_counter() - t
+    t = time.perf_counter()
+    for _ in range(1000):
+        engine.fit(COLUMNS[0]), engine.cov(COLUMNS[0]), engine.corr(COLUMNS[0])
+    t_serve = (time.perf_counter() - t) / 1000
+    print(f"  sklearn refit (one feature)     {t_sklearn * 1e3:10.2f} ms")
+    print(f"  engine build (all features)     {t_build * 1e3:10.2f} ms")
+    print(f"  engine append {delta_rows:,} rows{'':<8}{t_append * 1e3:10.2f} ms")
+    print(f"  engine fit + cov + corr         {t_serve * 1e6:10.2f} us")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3])) if len(sys.argv) > 2 else main(1_000_000, 10_000)
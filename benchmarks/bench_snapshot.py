@@ -0,0 +1,51 @@
+"""CSV vs columnar snapshot: cold-load time and peak RSS, each measured in a fresh interpreter.
+
+    python -m benchmarks.bench_snapshot 100000 1000000
+"""
+import os
+import sys
+import json
+import tempfile
+import subprocess
+from benchmarks.synthetic import write_games_csv
+
+# Each case runs in its own process so peak RSS is not polluted by the previous one
+_CASE = """
+import json, time
+from analysis import loader, snapshot
+path = {path!r}
+t = time.perf_counter()
+{stmt}
+elapsed = time.perf_counter() - t
+# VmHWM is reset on exec, unlike ru_maxrss which would report the parent's peak
+hwm = next(l for l in open("/proc/self/status") if l.startswith("VmHWM")).split()[1]
+print(json.dumps({{"seconds": elapsed, "max_rss_mb": int(hwm) / 1024}}))
+"""
+CASES = {
+    "imports only": "pass",
+    "read_csv + clean": "loader.parse_games(path)",
+    "snapshot, all columns": "snapshot.read_snapshot(snapshot.snapshot_path(path))",
+    "snapshot, Revenue.Estimated": "snapshot.read_snapshot(snapshot.snapshot_path(path), ['Revenue.Estimated'])",
+}
+
+
+def run_case(path, stmt):
+    out = subprocess.run([sys.executable, "-c", _CASE.format(path=path, stmt=stmt)], check=True,
+                         capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(sizes):
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            path = write_games_csv(os.path.join(tmp, f"games_{n}.csv"), n)
+            from analysis import loader
+            loader.ingest(path)   # One-off conversion, not part of the timed load
+            print(f"\n{n:,} rows")
+            for name, stmt in CASES.items():
+                r = run_case(path, stmt)
+                print(f"  {name:<30} {r['seconds']:8.3f} s  {r['max_rss_mb']:9.1f} MB peak RSS")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100_000, 1_000_000])
@@ -0,0 +1,128 @@
+"""Per-stage latency and peak memory of every page's computations on synthetic datasets.
+
+Each dataset size runs in a fresh interpreter that calls the pages' own stage functions
+(``analysis.views``) headlessly under ``analysis.profiling``, so every cache starts cold and stage
+names match the pages' "Stage timings" table. Per-stage wall time and peak traced memory (timings
+include tracemalloc's overhead) are compared against ``stages_baseline.json``. A stage that exceeds
+its baseline by more than ``THRESHOLD`` times, and by more than the noise floor, fails the run (exit
+code 1).
+
+The baseline holds absolute times from the machine that recorded it: run ``--update`` once on each
+host (or CI runner) before comparing there, and re-record it after an intended change.
+
+    python -m benchmarks.bench_stages                       # 1k, 10k, 100k and 1M rows vs the baseline
+    python -m benchmarks.bench_stages 10000000              # any sizes, e.g. 10M rows
+    python -m benchmarks.bench_stages --update 1000 10000   # record these sizes in the baseline
+"""
+import os
+import sys
+import json
+import tempfile
+import subprocess
+from benchmarks.synthetic import write_games_csv
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stages_baseline.json")
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+THRESHOLD = 1.5
+MIN_MS, MIN_MB = 20.0, 8.0   # Noise floor: smaller regressions are never reported
+
+
+def run_pages(path):
+    """Run Home, Descriptive, Distributions and Regression's stages (``analysis.views``) on one CSV with their
+    default widget values and every optional section on; returns the profiler records."""
+    import numpy as np
+    from analysis import views
+    from analysis.aggregates import FREQUENCY_OPTIONS
+    from analysis.charts import SCATTER_BUDGET
+    from analysis.profiling import Profiler, stage
+
+    with Profiler() as profiler:
+        with stage("import plotting"):   # Paid once per process by whichever page renders first
+            import matplotlib.pyplot, seaborn, scipy.stats   # noqa: F401
+        with stage("Home"):   # First page: its load stage also parses the CSV and writes the snapshot
+            df = views.home_games(path=path)
+            views.home_cube(path=path)
+            for option in FREQUENCY_OPTIONS:
+                views.home_frequency(option, path=path)
+            views.top_games(df, "Revenue.Estimated")
+        with stage("Descriptive"):
+            column = "Revenue.Estimated"
+            summary, sketch, values = views.descriptive_summary(column, path=path)
+            views.descriptive_intervals(column, path=path)
+            views.box_plot_png("Revenue Estimated", summary, sketch, values, path=path)
+            views.descriptive_summary(column, streaming=True, path=path)
+        with stage("Distributions"):
+            df = views.distribution_games(path=path)
+            revenue_fit, price_fit = views.normal_fits(path=path)
+            views.normal_fit_png(np.log1p(df["Revenue.Estimated"]), revenue_fit,
+                                 "Revenue Distribution with Normal Fit", "Log(Revenue Estimated)", path=path)
+            views.revenue_bands(path=path)
+            views.normal_fit_png(df["Launch.Price"], price_fit,
+                                 "Launch Price Distribution with Normal Fit", "Launch Price ($)", path=path)
+        with stage("Regression"):
+            features = ["Reviews.Total", "Launch.Price", "Revenue.Estimated"]
+            df = views.regression_games(features, path=path)
+            keep = views.regression_rows(features, path=path)
+            engine = views.regression_engine(features, path=path)
+            views.scatter_png(df, keep, engine, "Reviews.Total", "Reviews Total", SCATTER_BUDGET, path=path)
+            views.correlation_png(engine, features, path=path)
+            views.slope_interval(features, "Reviews.Total", path=path)
+    return [r for r in profiler.records if r is not None]
+
+
+def measure(path):
+    out = subprocess.run([sys.executable, "-m", "benchmarks.bench_stages", "--run", path], cwd=ROOT, check=True,
+                         capture_output=True, text=True, env={**os.environ, "PYTHONPATH": ROOT})
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def stage_keys(records):
+    """Unique "Parent/child" names, so repeated stages (e.g. several frequency tables) stay distinct."""
+    keyed, path, seen = {}, [], {}
+    for r in records:
+        del path[r["depth"]:]
+        path.append(r["stage"])
+        key = "/".join(path)
+        seen[key] = seen.get(key, 0) + 1
+        keyed[key if seen[key] == 1 else f"{key} #{seen[key]}"] = r
+    return keyed
+
+
+def main(sizes, update=False):
+    baseline = json.load(open(BASELINE)) if os.path.exists(BASELINE) else {}
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            result = measure(write_games_csv(os.path.join(tmp, f"games_{n}.csv"), n))
+            base = baseline.get(str(n), {})
+            print(f"\n{n:,} rows  (process peak RSS {result['max_rss_mb']:.0f} MB)")
+            stages = {}
+            for key, r in stage_keys(result["records"]).items():
+                ms, mb = r["seconds"] * 1000, r["peak_mb"]
+                stages[key] = {"ms": round(ms, 2), "peak_mb": round(mb, 2)}
+                old = base.get(key)
+                status = ""
+                if old and not update:
+                    slow = ms > old["ms"] * THRESHOLD and ms - old["ms"] > MIN_MS
+                    heavy = mb > old["peak_mb"] * THRESHOLD and mb - old["peak_mb"] > MIN_MB
+                    status = "FAIL" if slow or heavy else "ok"
+                    failed |= status == "FAIL"
+                name = "  " * r["depth"] + r["stage"]
+                print(f"  {name:<44} {ms:10.1f} ms {mb:9.1f} MB  {status}")
+            if update:
+                baseline[str(n)] = stages
+    if update:
+        json.dump(baseline, open(BASELINE, "w"), indent=2)
+        print(f"\nbaseline written to {os.path.relpath(BASELINE, ROOT)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--run"]:
+        records = run_pages(sys.argv[2])
+        hwm = next(l for l in open("/proc/self/status") if l.startswith("VmHWM")).split()[1]
+        print(json.dumps({"records": records, "max_rss_mb": int(hwm) / 1024}))
+    else:
+        args = [a for a in sys.argv[1:] if a != "--update"]
+        sys.exit(main([int(a) for a in args] or SIZES, update="--update" in sys.argv))
@@ -0,0 +1,78 @@
+"""Import-time startup benchmark for the Streamlit pages.
+
+For each page, the import statements that run before its first Streamlit call -- i.e. before first
+paint -- are extracted (with ``ast``) and run in a fresh interpreter under ``python -X importtime``. The script reports each page's total import time and its
+slowest modules. Times are divided by that of a bare ``REFERENCE`` import (the two libraries every page
+needs anyway) timed the same way on the same machine, so ``startup_baseline.json`` holds host-independent
+ratios; a page whose ratio exceeds its baseline times ``THRESHOLD`` fails the run (exit code 1).
+
+    python -m benchmarks.bench_startup            # check against the baseline
+    python -m benchmarks.bench_startup --update   # rewrite the baseline (after an intended import change)
+"""
+import os
+import ast
+import sys
+import json
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGES = ["Home.py", "pages/Descriptive.py", "pages/Distributions.py", "pages/Regression.py"]
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_baseline.json")
+REFERENCE = "import streamlit, pandas"
+THRESHOLD = 1.5
+REPEAT = 3
+
+
+def page_imports(page):
+    tree = ast.parse(open(os.path.join(ROOT, page), encoding="utf-8").read())
+    leading = []
+    for node in tree.body:
+        if not isinstance(node, (ast.Import, ast.ImportFrom)):
+            break
+        leading.append(ast.unparse(node))
+    return "\n".join(leading)
+
+
+def import_profile(code):
+    """{top-level module: cumulative microseconds} from one -X importtime run."""
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True,
+                         text=True, check=True, env={**os.environ, "PYTHONPATH": ROOT})
+    profile = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name[1:2] != " ":   # Nested imports are indented; their time is already in the parent's cumulative
+            profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def measure(code):
+    runs = [import_profile(code) for _ in range(REPEAT)]
+    best = min(runs, key=lambda p: sum(p.values()))
+    return sum(best.values()) / 1000, sorted(best.items(), key=lambda kv: -kv[1])[:5]
+
+
+def main(update=False):
+    baseline = json.load(open(BASELINE)) if os.path.exists(BASELINE) else {}
+    results, failed = {}, False
+    reference_ms, _ = measure(REFERENCE)
+    print(f"{REFERENCE!r:<26} {reference_ms:8.1f} ms  (reference)")
+    for page in PAGES:
+        total_ms, slowest = measure(page_imports(page))
+        ratio = results[page] = round(total_ms / reference_ms, 3)
+        limit = baseline.get(page, float("inf")) * THRESHOLD
+        status = "FAIL" if ratio > limit and not update else "ok"
+        failed |= status == "FAIL"
+        print(f"{page:<26} {total_ms:8.1f} ms  x{ratio:.2f} reference  (baseline x{baseline.get(page, '-')}, "
+              f"limit x{THRESHOLD} baseline)  {status}")
+        for name, us in slowest:
+            print(f"    {name:<30} {us / 1000:8.1f} ms")
+    if update:
+        json.dump(results, open(BASELINE, "w"), indent=2)
+        print(f"baseline written to {os.path.relpath(BASELINE, ROOT)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(update="--update" in sys.argv))
@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+
+COLUMNS = ["Title", "Reviews.Total", "Release.Date", "Launch.Price", "Revenue.Estimated"]
+
+
+def make_games(n_rows, seed=0):
+    """Synthetic Steam-like catalogue with the same five columns and rough shape as games.csv."""
+    rng = np.random.default_rng(seed)
+    reviews = np.maximum(rng.lognormal(9.5, 1.2, n_rows).astype(np.int64), 1)
+    price = rng.choice([4.99, 9.99, 14.99, 19.99, 24.99, 29.99, 39.99, 49.99, 59.99, 69.99], n_rows)
+    days = rng.integers(0, (pd.Timestamp("2025-12-31") - pd.Timestamp("1998-01-01")).days, n_rows)
+    release = (np.datetime64("1998-01-01") + days.astype("timedelta64[D]")).astype(str)
+    revenue = np.round(reviews * price * rng.uniform(0.8, 1.2, n_rows), 2)
+    return pd.DataFrame({
+        "Title": np.char.add("Game ", np.arange(n_rows).astype(str)),
+        "Reviews.Total": reviews,
+        "Release.Date": release,
+        "Launch.Price": price,
+        "Revenue.Estimated": revenue,
+    })
+
+
+def write_games_csv(path, n_rows, seed=0):
+    make_games(n_rows, seed).to_csv(path, index=False)
+    return path
@@ -1,46 +1,37 @@
+import os
 import streamlit as st
 import pandas as pd
-import seaborn as sns            # For creating statistical visualizations
-import matplotlib.pyplot as plt  # For plotting graphs and figures
-import scipy.stats as stats      # For performing statistical tests and analysis
+from analysis.loader import DATA_PATH
+from analysis.page import setup_page, show_stage_timings
+from analysis.query import require_rows, sidebar_filters
+from analysis.stats import intervals
+from analysis.streaming import STREAMING_MIN_BYTES, load_stream_bounds
+from analysis.views import box_plot_png, descriptive_intervals, descriptive_summary   # The page's computations, one timed stage each
 
-st.markdown("<h1 style='text-align: center;'>🧾 Descriptive Statistics</h1>", unsafe_allow_html=True)   # Titles & Styling
-st.markdown("""
-    <style>
-    .main, .css-18e3th9, .css-1d391kg, .stApp {
-        background-color: #599cba;
-        color: white;
-    }
-    h1, h3 { color: white; }
-    .nav-item { font-size: 18px; margin-right: 20px; display: inline-block; }
-    .nav-item a { color: white; text-decoration: none; }
-    .nav-item a:hover { color: #ffa500; }
-    </style>
-""", unsafe_allow_html=True)
+setup_page("🧾 Descriptive Statistics")   # Titles & Styling
 
 # Load data & select variable
-df = pd.read_csv("games.csv")
-df.columns = df.columns.str.strip()
+streaming = st.sidebar.toggle("Streaming mode", value=os.path.getsize(DATA_PATH) > STREAMING_MIN_BYTES,
+                              help="Read the CSV in chunks with one-pass accumulators; quartiles are sketch estimates within 0.5%.")
+# Streaming never loads or indexes the dataset: slider ranges come from a chunked pass, slices are filtered per chunk
+filters = sidebar_filters(bounds=load_stream_bounds() if streaming else None)
 column_map = {
     "Revenue Estimated": "Revenue.Estimated",
     "Reviews Total": "Reviews.Total",
     "Launch Price": "Launch.Price"
 }
 display_col = st.selectbox("Select Variable:", list(column_map.keys()))
-col = pd.to_numeric(df[column_map[display_col]], errors='coerce').dropna()
+column = column_map[display_col]
+summary, sketch, col = descriptive_summary(column, filters, streaming)   # Sketch only in streaming mode, raw values only in memory
+require_rows(summary["n"])
 
 # Central Tendency and Dispersion
-mean, median, std, var = col.mean(), col.median(), col.std(), col.var()
-rng, q1, q3 = col.max() - col.min(), col.quantile(0.25), col.quantile(0.75)
-iqr = q3 - q1
-# Confidence Interval (95%)
-n = len(col)
-se = std / (n ** 0.5)
-z = stats.norm.ppf(0.975)
-ci_lower, ci_upper = mean - z * se, mean + z * se
-# 3-Sigma and Outlier Bounds
-lower_3sd, upper_3sd = mean - 3*std, mean + 3*std
-lower_out, upper_out = q1 - 1.5*iqr, q3 + 1.5*iqr
+mean, median, std, var = summary["mean"], summary["median"], summary["std"], summary["var"]
+rng, q1, q3 = summary["max"] - summary["min"], summary["q1"], summary["q3"]
+# Confidence Interval (95%), 3-Sigma and Outlier Bounds
+bounds = intervals(summary)
+iqr, ci_lower, ci_upper = bounds["iqr"], bounds["ci_lower"], bounds["ci_upper"]
+lower_out, upper_out = bounds["lower_out"], bounds["upper_out"]
 
 # Central Tendency Output
 st.subheader("📌 Central Tendency")
@@ -71,12 +62,24 @@ st.markdown(
     This means we're 95% confident the true average of this variable lies within this range.
     """
 )
+# Bootstrap Intervals Output (resampled rows, no normality assumption)
+st.subheader("🎲 Bootstrap Intervals (95%)")
+if streaming:
+    st.caption("Bootstrap intervals resample rows in memory; switch off streaming mode to compute them.")
+elif not st.checkbox("Compute bootstrap intervals", help="Resamples the slice 2,000 times; takes a few seconds on large slices."):
+    st.caption("Tick the box to resample the current slice.")
+else:
+    boot = descriptive_intervals(column, filters)
+    st.dataframe(pd.DataFrame({
+        "Statistic": ["Mean", "Median", "IQR"],
+        "Estimate": [f"{b['estimate']:,.2f}" for b in boot],
+        "95% Interval": [f"{b['ci_lower']:,.2f} to {b['ci_upper']:,.2f}" for b in boot]
+    }), use_container_width=True)
 
 # Box Plot
 st.markdown("<h1 style='text-align: center;'>📦 Box Plot</h1>", unsafe_allow_html=True)   # Titles & Styling
 show_outliers = st.checkbox("Show Outliers", value=False)
-fig, ax = plt.subplots(figsize=(8, 6))
-sns.boxplot(data=col, ax=ax, color='skyblue', showfliers=show_outliers)
-ax.set_title(f"Box Plot of {display_col} ({'With' if show_outliers else 'Without'} Outliers)")
-ax.set_ylabel(display_col)
-st.pyplot(fig)
\ No newline at end of file
+png = box_plot_png(display_col, summary, sketch, col, show_outliers, filters)
+st.image(png, use_container_width=True)
+
+show_stage_timings()
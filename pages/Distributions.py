@@ -1,42 +1,25 @@
 import pandas as pd
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
 import streamlit as st
-from scipy.stats import norm
+from analysis.page import setup_page, show_stage_timings
+from analysis.query import require_rows, sidebar_filters
+from analysis.stats import revenue_probabilities   # Normal CDFs via the standard library, no scipy import
+from analysis.views import REVENUE_BANDS, distribution_games, normal_fit_png, normal_fits, revenue_bands
 
-st.markdown("<h1 style='text-align: center;'>📊 Probability Distributions</h1>", unsafe_allow_html=True)    # Titles & Styling
-st.markdown("""
-    <style>
-    .main, .css-18e3th9, .css-1d391kg, .stApp {
-        background-color: #599cba;
-        color: white;
-    }
-    h1, h3 { color: white; }
-    .nav-item { font-size: 18px; margin-right: 20px; display: inline-block; }
-    .nav-item a { color: white; text-decoration: none; }
-    .nav-item a:hover { color: #ffa500; }
-    </style>
-""", unsafe_allow_html=True)
+setup_page("📊 Probability Distributions")    # Titles & Styling
 
 # Load data
-df = pd.read_csv("games.csv")
-df.columns = df.columns.str.strip()
-df["Revenue.Estimated"] = pd.to_numeric(df["Revenue.Estimated"], errors="coerce")
-df["Reviews.Total"] = pd.to_numeric(df["Reviews.Total"], errors="coerce")
-df["Launch.Price"] = pd.to_numeric(df["Launch.Price"], errors="coerce")
-df.dropna(subset=["Revenue.Estimated", "Reviews.Total", "Launch.Price"], inplace=True)
-df["Transformed_Revenue"] = np.log1p(df["Revenue.Estimated"])   # Revenue Estimated (log transformation)
+filters = sidebar_filters()
+df = distribution_games(filters)
+require_rows(len(df), 2)
+transformed_revenue = np.log1p(df["Revenue.Estimated"])   # Revenue Estimated (log transformation)
+revenue_fit, price_fit = normal_fits(filters)   # Normal fits from merged partition statistics
 
 # Reusable plot + stats display
-def plot_and_display_distribution(data, title, label):
-    mean, std = norm.fit(data)
-    x = np.linspace(data.min(), data.max(), 100)
-    fig, ax = plt.subplots(figsize=(8, 6))
-    sns.histplot(data, bins=50, stat="density", color="#007bb3", ax=ax)
-    ax.plot(x, norm.pdf(x, mean, std), 'k', lw=2)
-    ax.set(title=title, xlabel=label, ylabel="Density")
-    st.pyplot(fig)
+def plot_and_display_distribution(data, title, label, fit):
+    mean, std = fit   # Same MLE as norm.fit(data)
+    png = normal_fit_png(data, fit, title, label, filters)   # Plotting libraries load only when a figure is actually rendered
+    st.image(png, use_container_width=True)
     stats_df = pd.DataFrame({"Measure": ["Mean (μ)", "Standard Deviation (σ)"],
                              "Value": [f"{mean:.2f}", f"{std:.2f}"]})
     st.dataframe(stats_df, use_container_width=True)
@@ -44,21 +27,28 @@ def plot_and_display_distribution(data, title, label):
 
 # Revenue distribution (log-transformed)
 st.subheader("📈 Log-Transformed Revenue Estimated Distribution")
-mean_rev, std_rev = plot_and_display_distribution(df["Transformed_Revenue"],
+mean_rev, std_rev = plot_and_display_distribution(transformed_revenue,
                                                   "Revenue Distribution with Normal Fit",
-                                                  "Log(Revenue Estimated)")
+                                                  "Log(Revenue Estimated)", revenue_fit)
 
 # Revenue probability estimates
-p1 = norm.cdf(np.log1p(1_000_000), loc=mean_rev, scale=std_rev)
-p2 = 1 - p1
-p3 = norm.cdf(np.log1p(7_500_000), loc=mean_rev, scale=std_rev) - norm.cdf(np.log1p(2_500_000), loc=mean_rev, scale=std_rev)
+probs = revenue_probabilities(mean_rev, std_rev)
+p1, p2, p3 = probs["p_below_1m"], probs["p_above_1m"], probs["p_2_5m_to_7_5m"]
 st.write("### Revenue Probability Estimates (based on log-normal distribution)")
 st.write(f"1. **P(Revenue < `$1.00M`)** ≈ {p1:.4f}")
 st.write(f"2. **P(Revenue > `$1.00M`)** ≈ {p2:.4f}")
 st.write(f"3. **P(`$2.50M` < Revenue < `$7.50M`)** ≈ {p3:.4f}")
 
+# Empirical probabilities (share of games in each band, with bootstrap 95% intervals)
+boot = revenue_bands(filters)
+st.write("### Empirical Probability Estimates (bootstrap 95% intervals)")
+for i, ((label, _, _), b) in enumerate(zip(REVENUE_BANDS, boot), start=1):
+    st.write(f"{i}. **{label}** ≈ {b['estimate']:.4f} ({b['ci_lower']:.4f} to {b['ci_upper']:.4f})")
+
 # Launch Price distribution
 st.subheader("💰 Launch Price Distribution")
 mean_price, std_price = plot_and_display_distribution(df["Launch.Price"],
                                                       "Launch Price Distribution with Normal Fit",
-                                                      "Launch Price ($)")
\ No newline at end of file
+                                                      "Launch Price ($)", price_fit)
+
+show_stage_timings()
@@ -1,25 +1,14 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-from sklearn.linear_model import LinearRegression  # Imports the LinearRegression model class used to perform simple or multiple linear regression
+from analysis.charts import SCATTER_BUDGET
+from analysis.page import setup_page, show_stage_timings
+from analysis.query import require_rows, sidebar_filters
+from analysis.views import (correlation_png, regression_engine, regression_games, regression_rows, scatter_png,
+                            slope_interval)   # Closed-form regression from cached sufficient statistics
 
-st.markdown("<h1 style='text-align: center;'>📈 Linear Regression</h1>", unsafe_allow_html=True)    # Titles & Styling
-st.markdown("""
-    <style>
-        .main, .css-18e3th9, .css-1d391kg, .stApp {
-            background-color: #599cba;
-            color: white;
-        }
-        h1, h3 { color: white; }
-        .nav-item { font-size: 18px; margin-right: 20px; display: inline-block; }
-        .nav-item a { color: white; text-decoration: none; }
-        .nav-item a:hover { color: #ffa500; }
-    </style>
-""", unsafe_allow_html=True)
+setup_page("📈 Linear Regression")    # Titles & Styling
 
 # Load data & select feature
-df = pd.read_csv('games.csv')
+filters = sidebar_filters()
 col_map = {
     "Reviews.Total": "Reviews Total",
     "Launch.Price": "Launch Price",
@@ -29,57 +18,43 @@ features = list(col_map.keys())
 display_feature = st.selectbox("Select Feature", [col_map[f] for f in features[:-1]])
 selected_feature = [k for k, v in col_map.items() if v == display_feature][0]
 
-# Apply IQR
-def iqr_filter(data, cols):
-    for col in cols:
-        Q1, Q3 = data[col].quantile([0.25, 0.75])
-        IQR = Q3 - Q1
-        data = data[(data[col] >= Q1 - 1.5 * IQR) & (data[col] <= Q3 + 1.5 * IQR)]
-    return data
-df_filtered = iqr_filter(df.copy(), features)
+# Apply IQR (row index and regression statistics are built once per dataset version and mode)
+iqr_mode = st.sidebar.radio("IQR Filter", ["Sequential", "Joint"],
+                            help="Sequential: each column's fences use the rows kept by the previous columns. "
+                                 "Joint: all fences come from the full data and are applied at once.").lower()
+point_budget = st.sidebar.number_input("Scatter Point Budget", min_value=500, value=SCATTER_BUDGET, step=500)
+df = regression_games(features, filters)   # Row positions in ``keep`` refer to this slice
+require_rows(len(df), 3)
+keep = regression_rows(features, iqr_mode, filters)
+require_rows(len(keep), 3)
+engine = regression_engine(features, iqr_mode, filters)
 
 # Linear Regression & Plot
-X = df_filtered[[selected_feature]]
-y = df_filtered["Revenue.Estimated"]
-model = LinearRegression().fit(X, y)
-y_pred = model.predict(X)
-sorted_idx = X[selected_feature].argsort()
-X_sorted, y_sorted, y_pred_sorted = X.iloc[sorted_idx], y.iloc[sorted_idx], y_pred[sorted_idx]
+B0, B1 = engine.fit(selected_feature)
 st.subheader(f"{display_feature} vs Revenue Estimated (IQR Filtered)")
-fig, ax = plt.subplots(figsize=(10, 6))
-ax.scatter(X, y, alpha=0.5, color='blue', label='Data')
-ax.plot(X_sorted, y_pred_sorted, '--', color='red', label='Regression Line')
-ax.set_xlabel(display_feature)
-ax.set_ylabel("Revenue Estimated")
-ax.legend()
-st.pyplot(fig)
+png = scatter_png(df, keep, engine, selected_feature, display_feature, point_budget, iqr_mode, filters)   # Drawn only on a cache miss
+st.image(png, use_container_width=True)
 
 # Covariance and Correlation
-cov = np.cov(X[selected_feature], y)[0, 1]
-corr = X[selected_feature].corr(y)
+cov, corr = engine.cov(selected_feature), engine.corr(selected_feature)
 st.markdown(f"**Covariance:** {cov:.4f}")
 st.markdown(f"**Correlation:** {corr:.4f}")
 
 # Correlation Matrix
 st.subheader("Correlation Matrix (IQR Filtered)")
-corr_matrix = df_filtered[features].corr()
-fig2, ax2 = plt.subplots()
-cax = ax2.matshow(corr_matrix, cmap='coolwarm')
-fig2.colorbar(cax)
-ticks = range(len(features))
-ax2.set_xticks(ticks); ax2.set_yticks(ticks)
-ax2.set_xticklabels(features, rotation=90)
-ax2.set_yticklabels(features)
-for (i, j), val in np.ndenumerate(corr_matrix.values):
-    ax2.text(j, i, f"{val:.2f}", ha='center', va='center')
-st.pyplot(fig2)
+png = correlation_png(engine, features, iqr_mode, filters)
+st.image(png, use_container_width=True)
 
 # Linear Regression Equation
-B0, B1 = model.intercept_, model.coef_[0]
 st.subheader("Linear Regression Equation")
 st.markdown(f"`Revenue Estimated = {B0:.2f} + {B1:.2f} × {display_feature}`")
 explanation = {
     "Reviews.Total": "each additional review is associated with",
     "Launch.Price": "each unit increase in price is associated with"
 }
-st.markdown(f"Based on the model, {explanation[selected_feature]} an estimated increase of **{B1:.2f}** in revenue.")
\ No newline at end of file
+st.markdown(f"Based on the model, {explanation[selected_feature]} an estimated increase of **{B1:.2f}** in revenue.")
+if st.checkbox("Bootstrap the slope", help="Resamples the IQR-filtered rows 2,000 times; takes a few seconds on large slices."):
+    slope = slope_interval(features, selected_feature, iqr_mode, filters)   # Pairs bootstrap over the IQR-filtered rows
+    st.markdown(f"**95% bootstrap interval for the slope:** {slope['ci_lower']:.2f} to {slope['ci_upper']:.2f}")
+
+show_stage_timings()
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+from analysis.binning import bin_counts, frequency_table, step_edges
+from benchmarks.bench_binning import SPECS, legacy_frequency_table
+from benchmarks.synthetic import make_games
+
+
+def edge_cases(step, max_val):
+    """Every edge, just below it, the last edge and above, NaN, negatives and infinities."""
+    edges = np.arange(0, max_val + step, step, dtype=float)
+    return np.concatenate([edges, edges[1:] - 0.01, [max_val, max_val * 10, np.nan, -0.01, -step, np.inf, -np.inf]])
+
+
+@pytest.mark.parametrize("column, step, max_val, prefix", SPECS)
+def test_matches_pd_cut(column, step, max_val, prefix):
+    values = np.concatenate([make_games(2_000)[column].to_numpy(dtype=float), edge_cases(step, max_val)])
+    old = legacy_frequency_table(pd.DataFrame({column: values}), column, step, max_val, prefix)
+    new = frequency_table(values, step, max_val, prefix)
+    assert list(new["Range"]) == list(old["Range"])
+    for col in ["Frequency", "Cumulative Frequency", "Relative Frequency (%)"]:
+        np.testing.assert_array_equal(new[col].to_numpy(), old[col].to_numpy(), err_msg=col)
+
+
+@pytest.mark.parametrize("column, step, max_val, prefix", SPECS)
+def test_bin_counts_match_step_counts(column, step, max_val, prefix):
+    values = edge_cases(step, max_val)
+    np.testing.assert_array_equal(bin_counts(values, step_edges(step, max_val)),
+                                  frequency_table(values, step, max_val, prefix)["Frequency"].to_numpy())
+
+
+def test_empty_input_has_zero_relative_frequency():
+    table = frequency_table(np.array([np.nan, -1.0]), 10, 60)
+    assert table["Frequency"].sum() == 0 and (table["Relative Frequency (%)"] == 0).all()
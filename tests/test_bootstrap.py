@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+from analysis.bootstrap import bootstrap, order_replicates, replicates
+from benchmarks.synthetic import make_games
+
+SPECS = [("median", 1), ("iqr", 1), ("band", 1, -np.inf, 1e6), ("median", 0)]
+
+
+@pytest.fixture(scope="module")
+def data():
+    return make_games(3_000)[["Reviews.Total", "Revenue.Estimated"]].to_numpy(dtype=float)
+
+
+@pytest.mark.parametrize("m", [3_000, 500])
+def test_order_replicates_match_resampled_rows(data, m):
+    gathered = replicates(data, SPECS, 20_000, m, workers=1)
+    drawn = order_replicates(data, SPECS, 20_000, m, seed=1)
+    np.testing.assert_allclose(drawn.mean(axis=0), gathered.mean(axis=0), rtol=0.01)
+    np.testing.assert_allclose(drawn.std(axis=0), gathered.std(axis=0), rtol=0.05)
+
+
+def test_mean_se_matches_analytic(data):
+    analytic = data[:, 1].std(ddof=1) / np.sqrt(len(data))
+    for m in (len(data), 1_000):
+        assert bootstrap(data, [("mean", 1)], 2_000, sample_size=m, workers=1)[0]["se"] == pytest.approx(analytic, rel=0.1)
+
+
+def test_intervals_bracket_the_estimate(data):
+    for result in bootstrap(data, SPECS + [("slope", 0, 1)], 500, workers=1):
+        assert result["ci_lower"] <= result["estimate"] <= result["ci_upper"]
+    assert all(np.isnan(r["estimate"]) for r in bootstrap(data[:0], SPECS, 100))
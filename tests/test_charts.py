@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+from analysis.charts import histogram_bars, stratified_sample
+
+
+@pytest.mark.parametrize("budget", [500, 1_000, 5_000])
+def test_sample_honours_the_budget(budget):
+    rng = np.random.default_rng(0)
+    x, y = rng.random(200_000), rng.random(200_000)
+    shown = stratified_sample(x, y, budget)
+    assert len(shown) == budget
+    assert np.all(np.diff(shown) > 0)
+
+
+def test_sample_keeps_outliers_and_small_inputs():
+    rng = np.random.default_rng(1)
+    x, y = np.append(rng.normal(size=50_000), 100.0), np.append(rng.normal(size=50_000), 100.0)
+    assert len(x) - 1 in stratified_sample(x, y, 1_000)
+    np.testing.assert_array_equal(stratified_sample(x[:10], y[:10], 1_000), np.arange(10))
+
+
+def test_histogram_drops_non_finite_values():
+    edges, heights = histogram_bars([1.0, 2.0, np.nan, np.inf, 3.0], bins=2)
+    assert heights.sum() == 3 and len(edges) == 3
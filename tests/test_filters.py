@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+from analysis.filters import iqr_bounds, iqr_index, iqr_mask
+from benchmarks.bench_filters import COLUMNS, legacy_iqr_filter
+from benchmarks.synthetic import make_games
+
+
+def test_bounds_match_pandas_quantiles():
+    df = make_games(2_000)[COLUMNS]
+    lower, upper = iqr_bounds(df.to_numpy(dtype=float))
+    q1, q3 = df.quantile(0.25).to_numpy(), df.quantile(0.75).to_numpy()
+    np.testing.assert_allclose(lower, q1 - 1.5 * (q3 - q1))
+    np.testing.assert_allclose(upper, q3 + 1.5 * (q3 - q1))
+
+
+def test_sequential_keeps_the_legacy_rows():
+    df = make_games(5_000, seed=3)[COLUMNS]
+    np.testing.assert_array_equal(iqr_index(df, COLUMNS, "sequential"), legacy_iqr_filter(df.copy(), COLUMNS).index)
+
+
+def test_joint_applies_full_data_fences():
+    values = make_games(5_000, seed=4)[COLUMNS].to_numpy(dtype=float)
+    lower, upper = iqr_bounds(values)
+    np.testing.assert_array_equal(iqr_mask(values, "joint"), ((values >= lower) & (values <= upper)).all(axis=1))
+    with pytest.raises(ValueError):
+        iqr_mask(values, "pairwise")
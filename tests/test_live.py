@@ -0,0 +1,116 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from analysis import live
+from analysis.aggregates import additive_cube, year_filter
+from analysis.loader import dataset_version, parse_games
+from analysis.parallel import frame_moments
+from analysis.query import Filters, GameIndex, load_slice
+from analysis.streaming import stream_describe
+from benchmarks.bench_live import MOMENT_COLS, make_delta
+from benchmarks.synthetic import make_games
+
+
+def rebuild(path):
+    """Base plus every delta by plain concatenation, last row per key winning."""
+    df = pd.concat([parse_games(path)] + [parse_games(os.path.join(live.delta_dir(path), name))
+                                          for name in live.delta_files(path)], ignore_index=True)
+    df["Title"] = df["Title"].astype(str)
+    return df[~df.duplicated(["Title", "Release.Date"], keep="last")].reset_index(drop=True)
+
+
+def add(path, df, name):
+    os.makedirs(live.delta_dir(path), exist_ok=True)
+    df.to_csv(os.path.join(live.delta_dir(path), name), index=False)
+
+
+@pytest.fixture
+def base(tmp_path):
+    path = str(tmp_path / "games.csv")
+    games = make_games(5_000)
+    games.to_csv(path, index=False)
+    return path, games
+
+
+def test_running_state_matches_rebuild(base):
+    path, games = base
+    store = live.LiveStore(path)
+    store.cube(0)
+    store.moments(MOMENT_COLS, ("Revenue.Estimated",), 0)
+    store.index(0)
+    for seed, size in enumerate([10, 200, 1_000], start=1):
+        add(path, make_delta(games, size, seed), f"{seed:04d}.csv")
+        store.refresh()
+    expected = rebuild(path)
+    got = store.frame()
+    got["Title"] = got["Title"].astype(str)
+    pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+    cube = store.cube(store.seq)
+    for key, value in additive_cube(year_filter(expected)).items():
+        a, b = (value[1], cube[key][1]) if isinstance(value, tuple) else (value.to_numpy(), cube[key].to_numpy())
+        np.testing.assert_allclose(b, a, err_msg=key)
+    moments = store.moments(MOMENT_COLS, ("Revenue.Estimated",), store.seq)
+    rebuilt = frame_moments(expected, MOMENT_COLS, ["Revenue.Estimated"])
+    assert moments["n"] == rebuilt["n"]
+    np.testing.assert_allclose(moments["mean"], rebuilt["mean"])
+    np.testing.assert_allclose(moments["comoment"], rebuilt["comoment"], rtol=1e-6)
+    index, fresh = store.index(store.seq), GameIndex(expected)
+    for col, sorted_index in fresh.columns.items():
+        np.testing.assert_array_equal(index.columns[col].order, sorted_index.order, err_msg=col)
+
+
+def test_loaders_stay_on_their_version(base):
+    path, games = base
+    add(path, make_delta(games, 100, 1), "0001.csv")
+    version = dataset_version(path)
+    filters = Filters(price=(10.0, 40.0))
+    before = load_slice(filters, path=path, version=version)
+    add(path, make_delta(games, 1_000, 2), "0002.csv")
+    assert dataset_version(path)[-1] == version[-1] + 1
+    # A slice at the earlier version still pairs that version's frame with that version's index
+    pd.testing.assert_frame_equal(load_slice(filters, path=path, version=version), before)
+    expected = live.get_store(path, version).frame(seq=version[-1])
+    expected = expected[expected["Launch.Price"].between(10.0, 40.0)].reset_index(drop=True)
+    pd.testing.assert_frame_equal(before, expected)
+    assert len(live.read_deltas(path, version)) == 100
+    summary, _ = stream_describe(path, "Launch.Price", chunk_rows=1_000, version=version)
+    assert summary["n"] == len(live.get_store(path, version).frame(seq=version[-1]))
+
+
+def test_bad_delta_is_skipped(base):
+    path, games = base
+    add(path, pd.DataFrame({"Title": ["x"]}), "0001-bad.csv")
+    add(path, make_delta(games, 50, 1), "0002.csv")
+    version = dataset_version(path)
+    assert version[-1] == 2   # Counted, though it will never apply
+    with pytest.warns(UserWarning, match="0001-bad.csv"):
+        store = live.get_store(path, version)
+    assert store.seq == 2 and len(store.frame(seq=1)) == len(store.frame(seq=0))   # The bad file adds no rows
+    assert len(store.frame()) > len(store.frame(seq=0))
+
+
+def test_compaction_evicts_the_old_store(base):
+    path, games = base
+    add(path, make_delta(games, 100, 1), "0001.csv")
+    old = dataset_version(path)
+    assert old[-1] == 1 and live.get_store(path, old) is not None
+    expected = rebuild(path)
+    assert live.compact(path) == len(expected)
+    assert live.delta_files(path) == []
+    assert live.poll(path) == 0
+    assert live.get_store(path, old) is None   # The superseded base frame is not kept alive
+    assert path not in live._stores
+    compacted = parse_games(path)
+    compacted["Title"] = compacted["Title"].astype(str)
+    pd.testing.assert_frame_equal(compacted, expected, check_dtype=False)
+
+
+def test_polling_builds_no_store(base):
+    path, games = base
+    add(path, make_delta(games, 100, 1), "0001.csv")
+    version = dataset_version(path)
+    assert version[-1] == 1
+    summary, _ = stream_describe(path, "Launch.Price", chunk_rows=1_000, version=version)
+    assert path not in live._stores   # Neither the poll nor a streaming read loads the catalogue
+    assert summary["n"] == len(live.get_store(path, version).frame())
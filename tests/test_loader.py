@@ -0,0 +1,33 @@
+import errno
+import os
+import pandas as pd
+import pytest
+from analysis import snapshot
+from analysis.loader import ingest, parse_games, read_games
+from benchmarks.synthetic import make_games
+
+
+@pytest.fixture
+def path(tmp_path):
+    make_games(500).to_csv(tmp_path / "games.csv", index=False)
+    return str(tmp_path / "games.csv")
+
+
+def test_unwritable_snapshot_falls_back_to_parsing(path, monkeypatch):
+    def full_disk(df, snap, version):
+        raise OSError(errno.ENOSPC, "No space left on device")
+    monkeypatch.setattr(snapshot, "write_snapshot", full_disk)
+    with pytest.warns(UserWarning, match="Cannot write snapshot"):
+        assert ingest(path) is None
+    with pytest.warns(UserWarning):
+        pd.testing.assert_frame_equal(read_games(path), parse_games(path))
+
+
+def test_failed_snapshot_write_leaves_no_temp_file(path, monkeypatch):
+    def broken(table, dest, **kwargs):
+        open(dest, "wb").write(b"partial")
+        raise OSError(errno.ENOSPC, "No space left on device")
+    monkeypatch.setattr(snapshot.feather, "write_feather", broken)
+    with pytest.raises(OSError):
+        snapshot.write_snapshot(parse_games(path), snapshot.snapshot_path(path), (0, 0))
+    assert sorted(os.listdir(os.path.dirname(path))) == ["games.csv"]
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from scipy import stats
+from analysis.parallel import (merge_moments, normal_fit, parallel_moments, partial_moments, remove_moments,
+                               summarize)
+from benchmarks.synthetic import make_games
+
+COLUMNS = ["Launch.Price", "Reviews.Total", "Revenue.Estimated"]
+
+
+@pytest.fixture(scope="module")
+def data():
+    values = make_games(20_001)[COLUMNS].to_numpy(dtype=float)
+    values[::97, 1] = np.nan   # Incomplete rows are dropped from every column alike
+    values[5::389, 2] = np.nan
+    return values
+
+
+def assert_same_moments(got, expected):
+    assert got["n"] == expected["n"]
+    np.testing.assert_allclose(got["mean"], expected["mean"], rtol=1e-12)
+    np.testing.assert_allclose(got["comoment"], expected["comoment"], rtol=1e-9)
+
+
+def test_pooled_partitions_match_a_single_pass(data):
+    single = parallel_moments(data, workers=1)
+    pooled = parallel_moments(data, workers=2, min_rows=0)
+    assert_same_moments(pooled, single)
+    assert single["n"] == (~np.isnan(data).any(axis=1)).sum()
+    np.testing.assert_array_equal(pooled["min"], single["min"])
+    np.testing.assert_array_equal(pooled["max"], single["max"])
+    np.testing.assert_array_equal(pooled["quartiles"], single["quartiles"])   # Exact in both cases
+    a, b = summarize(pooled, COLUMNS), summarize(single, COLUMNS)
+    np.testing.assert_allclose(a["corr"], b["corr"], rtol=1e-9)
+
+
+def test_merge_and_remove_are_exact(data):
+    cut = 7_000
+    first, second = partial_moments(data[:cut]), partial_moments(data[cut:])
+    whole = partial_moments(data)
+    merged = merge_moments(first, second)
+    assert_same_moments(merged, whole)
+    np.testing.assert_array_equal(merged["min"], whole["min"])
+    np.testing.assert_array_equal(merged["max"], whole["max"])
+    for got, expected in zip(merged["sketches"], partial_moments(data)["sketches"]):
+        assert got.pos == expected.pos and got.n == expected.n
+    assert_same_moments(remove_moments(whole, second), partial_moments(data[:cut]))
+    assert_same_moments(remove_moments(whole, partial_moments(data[:0])), whole)
+    assert remove_moments(whole, whole)["n"] == 0
+    assert merge_moments({"n": 0}, whole) is whole and merge_moments(whole, {"n": 0}) is whole
+
+
+def test_normal_fit_matches_scipy(data):
+    moments = parallel_moments(data, workers=2, min_rows=0)
+    complete = data[~np.isnan(data).any(axis=1)]
+    for j in range(len(COLUMNS)):
+        np.testing.assert_allclose(normal_fit(moments, j), stats.norm.fit(complete[:, j]), rtol=1e-9)
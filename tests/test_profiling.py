@@ -0,0 +1,31 @@
+import gc
+import threading
+import tracemalloc
+from analysis.profiling import Profiler, release_tracing, stage
+
+
+def test_nested_stages_are_recorded_in_order():
+    with Profiler() as profiler:
+        with stage("outer"):
+            with stage("inner"):
+                bytearray(1 << 20)
+    assert [(r["stage"], r["depth"]) for r in profiler.records] == [("outer", 0), ("inner", 1)]
+    assert profiler.records[0]["peak_mb"] >= profiler.records[1]["peak_mb"] >= 0.9
+    assert not tracemalloc.is_tracing()
+
+
+def test_profiler_left_open_on_another_thread_stops_tracing():
+    left = []
+    thread = threading.Thread(target=lambda: left.append(Profiler().__enter__()))   # A run that never exited
+    thread.start(), thread.join()
+    assert tracemalloc.is_tracing()
+    left[0].__exit__(None, None, None)   # Closed later from a different thread
+    assert not tracemalloc.is_tracing()
+
+
+def test_abandoned_profiler_releases_tracing():
+    thread = threading.Thread(target=lambda: Profiler().__enter__())
+    thread.start(), thread.join()
+    gc.collect()
+    release_tracing()
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+from analysis.loader import parse_games
+from analysis.query import Filters, GameIndex, filter_mask, load_index, load_slice
+from analysis.streaming import stream_bounds
+from benchmarks.bench_query import QUERIES
+from benchmarks.synthetic import make_games
+
+
+@pytest.fixture(scope="module")
+def games(tmp_path_factory):
+    path = tmp_path_factory.mktemp("data") / "games.csv"
+    make_games(20_000).to_csv(path, index=False)
+    return str(path), parse_games(str(path))
+
+
+@pytest.mark.parametrize("filters", [*QUERIES.values(), Filters(years=(1990, 2025)), Filters(price=(100.0, 200.0))],
+                         ids=[*QUERIES, "broad years", "no match"])
+def test_index_plan_matches_scan(games, filters):
+    _, df = games
+    np.testing.assert_array_equal(GameIndex(df).positions(filters), np.flatnonzero(filter_mask(df, filters)))
+
+
+def test_stream_bounds_match_index(games):
+    path, df = games
+    index = GameIndex(df)
+    bounds = stream_bounds(path, chunk_rows=3_000)
+    for col, sorted_index in index.columns.items():
+        assert bounds[col] == sorted_index.bounds
+
+
+def test_slices_gather_projected_columns(games):
+    path, df = games
+    filters = Filters(price=(10.0, 40.0), title="game 1")
+    assert load_index(path).titles is None   # Built from the numeric columns only
+    got = load_slice(filters, columns=["Launch.Price", "Revenue.Estimated"], path=path)
+    expected = df.loc[filter_mask(df, filters), ["Launch.Price", "Revenue.Estimated"]].reset_index(drop=True)
+    pd.testing.assert_frame_equal(got, expected)
+    assert load_index(path).titles is not None   # Title dictionary loaded by the first title filter
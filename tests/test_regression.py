@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+from analysis.regression import RegressionEngine
+from benchmarks.synthetic import make_games
+
+COLUMNS = ["Reviews.Total", "Launch.Price", "Revenue.Estimated"]
+
+
+def assert_matches_sklearn(engine, df):
+    for feature in COLUMNS[:-1]:
+        model = LinearRegression().fit(df[[feature]], df["Revenue.Estimated"])
+        b0, b1 = engine.fit(feature)
+        scale = abs(df["Revenue.Estimated"].mean())   # B0 is a difference of large means, so compare it on the target's scale
+        assert b0 == pytest.approx(model.intercept_, rel=1e-9, abs=1e-9 * scale)
+        assert b1 == pytest.approx(model.coef_[0], rel=1e-9)
+        assert engine.cov(feature) == pytest.approx(np.cov(df[feature], df["Revenue.Estimated"])[0, 1], rel=1e-9)
+        assert engine.corr(feature) == pytest.approx(df[feature].corr(df["Revenue.Estimated"]), rel=1e-9)
+    np.testing.assert_allclose(engine.cov_matrix(), np.cov(df[COLUMNS].to_numpy(dtype=float).T), rtol=1e-9)
+    np.testing.assert_allclose(engine.corr_matrix(), df[COLUMNS].corr().to_numpy(), rtol=1e-9)
+
+
+def test_fit_matches_sklearn():
+    df = make_games(5_000)[COLUMNS]
+    assert_matches_sklearn(RegressionEngine.from_frame(df, COLUMNS, workers=1), df)
+
+
+def test_append_matches_refit():
+    df = make_games(6_000, seed=1)[COLUMNS]
+    engine = RegressionEngine.from_frame(df.iloc[:5_000], COLUMNS, workers=1)
+    engine.append(df.iloc[5_000:5_500]).append(df.iloc[5_500:])
+    assert engine.n == len(df)
+    assert_matches_sklearn(engine, df)
+
+
+def test_rows_restrict_the_fit():
+    df = make_games(3_000, seed=2)[COLUMNS]
+    rows = np.flatnonzero(df["Launch.Price"].to_numpy() < 30)
+    engine = RegressionEngine.from_frame(df, COLUMNS, workers=1, rows=rows)
+    assert_matches_sklearn(engine, df.iloc[rows])
@@ -0,0 +1,36 @@
+from analysis.aggregates import FREQUENCY_OPTIONS, year_filter
+from analysis.binning import frequency_table
+from analysis.loader import parse_games
+from analysis.report import dataset_slice_keys, select_slice, slice_keys, slice_report
+from benchmarks.synthetic import make_games
+
+
+def games(tmp_path):
+    df = make_games(1_000)
+    df.loc[:9, "Launch.Price"] = 99.99          # Above the last price edge
+    df.loc[10:19, "Release.Date"] = "1985-06-01"  # Outside Home's year window
+    df.to_csv(tmp_path / "games.csv", index=False)
+    return parse_games(str(tmp_path / "games.csv"))
+
+
+def test_price_bands_cover_every_game(tmp_path):
+    df = games(tmp_path)
+    bands = [select_slice(df, "price-band", key) for key in slice_keys(df, "price-band")]
+    assert sum(len(b) for b in bands) == len(df)
+    assert len(select_slice(df, "price-band", slice_keys(df, "price-band")[-1])) == 10
+
+
+def test_frequency_tables_match_home(tmp_path):
+    df = games(tmp_path)
+    report = slice_report(df)
+    for option, (col, step, max_val, prefix) in FREQUENCY_OPTIONS.items():
+        home = frequency_table(year_filter(df)[col].to_numpy(), step, max_val, prefix)
+        assert report["frequency"][option] == home.to_dict("records")
+
+
+def test_slice_keys_read_only_what_they_need(tmp_path):
+    df = games(tmp_path)
+    assert dataset_slice_keys(str(tmp_path / "games.csv"), "year") == slice_keys(df, "year")
+    # Price bands and the whole-dataset slice are fixed: the dataset is never opened
+    assert dataset_slice_keys(str(tmp_path / "missing.csv"), "price-band") == slice_keys(df, "price-band")
+    assert dataset_slice_keys(str(tmp_path / "missing.csv"), "all") == ["all"]
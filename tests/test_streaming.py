@@ -0,0 +1,76 @@
+import math
+import numpy as np
+import pytest
+from matplotlib import cbook
+from analysis.loader import NUMERIC_COLS, parse_games
+from analysis.stats import describe
+from analysis.streaming import REL_ERR, QuantileSketch, box_stats, stream_describe
+from benchmarks.synthetic import make_games
+
+QUANTILES = {"q1": 0.25, "median": 0.5, "q3": 0.75}
+
+
+@pytest.fixture(scope="module")
+def path(tmp_path_factory):
+    df = make_games(20_000)
+    rng = np.random.default_rng(1)
+    df.loc[rng.choice(len(df), 2_000, replace=False), "Launch.Price"] = 0.0   # Free games
+    refunds = rng.choice(len(df), 1_000, replace=False)
+    df.loc[refunds, "Revenue.Estimated"] = -df.loc[refunds, "Revenue.Estimated"]   # Net of refunds
+    path = tmp_path_factory.mktemp("stream") / "games.csv"
+    df.to_csv(path, index=False)
+    return str(path)
+
+
+def order_statistic(values, q):
+    """The exact value the sketch approximates: rank floor(q * (n - 1)) of the sorted values."""
+    return np.sort(values)[math.floor(q * (len(values) - 1))]
+
+
+@pytest.mark.parametrize("column", NUMERIC_COLS)
+def test_matches_in_memory_describe(path, column):
+    values = parse_games(path)[column].to_numpy(dtype=float)
+    exact = describe(values)
+    for chunk_rows in (1_000, 7_777):
+        summary, _ = stream_describe(path, column, chunk_rows=chunk_rows)
+        assert summary["n"] == exact["n"]
+        for key in ("mean", "var", "std", "min", "max"):
+            assert summary[key] == pytest.approx(exact[key], rel=1e-9), key
+        for key, q in QUANTILES.items():
+            expected = order_statistic(values, q)
+            assert abs(summary[key] - expected) <= REL_ERR * abs(expected), (chunk_rows, key)
+
+
+def test_result_does_not_depend_on_chunking(path):
+    small, sketch_small = stream_describe(path, "Revenue.Estimated", chunk_rows=1_000)
+    large, sketch_large = stream_describe(path, "Revenue.Estimated", chunk_rows=7_777)
+    assert sketch_small.pos == sketch_large.pos and sketch_small.neg == sketch_large.neg
+    assert {k: small[k] for k in QUANTILES} == {k: large[k] for k in QUANTILES}
+
+
+def test_sketch_handles_zeros_and_negatives():
+    values = np.concatenate([np.zeros(100), -np.geomspace(1, 1e6, 500), np.geomspace(1e-3, 1e9, 1_000), [np.nan]])
+    sketch = QuantileSketch().update(values[:700]).merge(QuantileSketch().update(values[700:]))
+    finite = values[~np.isnan(values)]
+    assert sketch.n == len(finite)
+    for q in np.linspace(0, 1, 41):
+        expected = order_statistic(finite, q)
+        assert abs(sketch.quantile(q) - expected) <= REL_ERR * abs(expected), q
+
+
+@pytest.mark.parametrize("column", NUMERIC_COLS)
+def test_box_stats_match_exact_boxplot(path, column):
+    values = parse_games(path)[column].to_numpy(dtype=float)
+    summary, sketch = stream_describe(path, column, chunk_rows=1_000)
+    stats = box_stats(summary, sketch, column, show_fliers=True)
+    exact = cbook.boxplot_stats(values)[0]
+    assert stats["label"] == column
+    assert stats["whislo"] <= stats["q1"] <= stats["med"] <= stats["q3"] <= stats["whishi"]
+    assert summary["min"] <= stats["whislo"] and stats["whishi"] <= summary["max"]
+    for key in ("whislo", "whishi"):   # Bucket representatives, so within the sketch's relative error
+        assert abs(stats[key] - exact[key]) <= 2 * REL_ERR * abs(exact[key]) + 1e-9, key
+    lo = stats["q1"] - 1.5 * (stats["q3"] - stats["q1"])
+    hi = stats["q3"] + 1.5 * (stats["q3"] - stats["q1"])
+    assert all((f < lo) or (f > hi) for f in stats["fliers"])
+    assert len(stats["fliers"]) <= len(sketch.buckets()[0])   # One point per bucket, not per game
+    assert len(box_stats(summary, sketch, column)["fliers"]) == 0